@@ -0,0 +1,16 @@
+"""
+Morse-Code per Handgesten: Frame-Analyse (capture), Entprellung (state_estimation)
+und Dekodierung (decoder).
+Ein einfacher Import lädt kein Modell und öffnet kein Video; MediaPipe/OpenCV
+werden erst in morse_code.capture bzw. beim ersten Aufruf gebraucht.
+"""
+from .bk_tree import BKTree
+from .decode_cache import DecodeCache
+from .decoder import decode_bits_beam, decode_with_lexicon_or_estimate, decode_with_score, default_lexicon_index
+from .lazy_lexicon import LazyLexicon
+from .lexicon_file import load_index, load_or_compile, save_index
+from .lexicon_index import LexiconIndex, edit_distance
+from .morse import BASE_WORDS, MORSE_TABLE, MORSE_TABLE_STR, bits_for_word, expand_lexicon, hamming_distance
+from .segment_decoder import SegmentDecoder
+from .state_estimation import (GAP_TOLERANCE, GAP_TOLERANCE_SECONDS, STABLE_MIN_FRAMES, STABLE_MIN_SECONDS, Debouncer,
+                               TimedDebouncer, debounce, debounce_timed, stream_bits, stream_bits_timed)
@@ -0,0 +1,148 @@
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .decoder import LEXICON_PATH, decode_with_score, default_lexicon_index
+from .morse import MORSE_TABLE
+from .profiling import PROFILER, enable
+from .state_estimation import GAP_TOLERANCE_SECONDS, REFERENCE_FPS, STABLE_MIN_SECONDS, stream_bits_timed
+
+
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv")
+
+
+# --- Dateien sammeln ---
+def collect_videos(pattern):
+    """Ordner (alle Videos darin) oder Glob-Muster wie 'Videos/Hello*.mp4' -> sortierte Pfadliste."""
+    if os.path.isdir(pattern):
+        return sorted(os.path.join(pattern, name) for name in os.listdir(pattern)
+                      if name.lower().endswith(VIDEO_EXTENSIONS))
+    return sorted(glob.glob(pattern))
+
+
+# --- Worker ---
+_hands = None    # ein MediaPipe-Hands pro Worker-Prozess
+
+
+def _init_worker(lexicon_path, profile=False):
+    global _hands
+    from .capture import create_hands
+
+    if profile:
+        enable()   # Messwerte gehen mit jedem Datensatz an den Hauptprozess (siehe _process)
+    _hands = create_hands()
+    default_lexicon_index(lexicon_path)   # Index einmal pro Prozess laden (mmap)
+
+
+def _video_hands():
+    """
+    MediaPipe-Hands des Prozesses für das nächste Video: beim direkten Aufruf von
+    process_video (ohne _init_worker) erst hier angelegt, sonst zurückgesetzt, damit
+    das Tracking (static_image_mode=False) nicht aus dem vorigen Video weiterläuft.
+    """
+    global _hands
+    if _hands is None:
+        from .capture import create_hands
+
+        _hands = create_hands()
+    else:
+        _hands.reset()
+    return _hands
+
+
+def process_video(video_path, stable_min_seconds=STABLE_MIN_SECONDS, gap_tolerance_seconds=GAP_TOLERANCE_SECONDS,
+                  distance="hamming", lexicon_path=LEXICON_PATH, cache=False, rule="tips"):
+    """
+    Ein Video komplett auswerten; gibt einen Ergebnis-Datensatz (dict) zurück.
+    cache: Landmarken aus dem Landmark-Cache abspielen bzw. beim ersten Lauf aufzeichnen;
+    rule: mit cache die Regel für offen/geschlossen (siehe hand_pose.RULES).
+    """
+    import cv2
+
+    from .capture import frame_states, open_video
+
+    start = time.perf_counter()
+    record = {"video": video_path}
+    try:
+        cap = open_video(video_path)
+        try:
+            fps = cap.get(cv2.CAP_PROP_FPS) or REFERENCE_FPS
+            frames = 0
+
+            def counted(samples):
+                nonlocal frames
+                for sample in samples:
+                    frames += 1
+                    yield sample
+
+            hands = _video_hands()
+            if cache:
+                from .landmark_cache import cached_recording
+
+                samples = cached_recording(video_path, hands=hands).samples(rule)
+            else:
+                samples = frame_states(cap, hands, timed=True)
+            bits = list(stream_bits_timed(counted(samples), stable_min_seconds, gap_tolerance_seconds, 1 / fps))
+        finally:
+            cap.release()
+
+        text, dist, acc = decode_with_score(bits, MORSE_TABLE, default_lexicon_index(lexicon_path),
+                                            distance=distance)
+        record.update(bits=bits, text=text, distance=dist, accuracy=acc, frames=frames)
+    except Exception as exc:   # ein defektes Video soll nicht den ganzen Lauf abbrechen
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    record["seconds"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+def _process(args):
+    record = process_video(*args)
+    return record, PROFILER.take() if PROFILER.enabled else None
+
+
+# --- Batch ---
+def run_batch(pattern, output=None, workers=None, stable_min_seconds=STABLE_MIN_SECONDS,
+              gap_tolerance_seconds=GAP_TOLERANCE_SECONDS, distance="hamming", lexicon_path=LEXICON_PATH,
+              cache=False, rule="tips"):
+    """
+    Wertet alle Videos zu pattern parallel aus (ein Prozess pro CPU, sofern workers nicht gesetzt).
+    Schreibt pro Datei eine JSON-Zeile nach output und gibt die Liste der Datensätze zurück.
+    Ist der Profiler eingeschaltet, werden die Messwerte der Worker im PROFILER gesammelt.
+    """
+    videos = collect_videos(pattern)
+    if not videos:
+        raise FileNotFoundError(f"Keine Videos gefunden: {pattern}")
+
+    default_lexicon_index(lexicon_path)   # im Hauptprozess kompilieren, bevor die Worker es laden
+    jobs = [(path, stable_min_seconds, gap_tolerance_seconds, distance, lexicon_path, cache, rule)
+            for path in videos]
+    workers = min(workers or os.cpu_count() or 1, len(videos))
+
+    records = []
+    start = time.perf_counter()
+    out = open(output, "w", encoding="utf-8") if output else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(lexicon_path, PROFILER.enabled)) as pool:
+            for record, profile in pool.map(_process, jobs):   # Reihenfolge wie in videos
+                if profile:
+                    PROFILER.merge(profile)
+                records.append(record)
+                if out:
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                if "error" in record:
+                    print(f"{record['video']}: FEHLER {record['error']}")
+                else:
+                    print(f"{record['video']}: '{record['text']}' Distanz: {record['distance']} | "
+                          f"Genauigkeit: {record['accuracy']}% ({record['frames']} Frames, {record['seconds']} s)")
+    finally:
+        if out:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    frames = sum(record.get("frames", 0) for record in records)
+    print(f"\n{len(records)} Videos in {elapsed:.1f} s mit {workers} Prozessen: "
+          f"{len(records) / elapsed * 60:.1f} Videos/min, {frames / elapsed:.1f} Frames/s")
+    return records
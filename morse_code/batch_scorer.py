@@ -0,0 +1,108 @@
+import numpy as np
+
+
+# Anzahl gesetzter Bits für jedes Byte (Lookup-Tabelle für popcount)
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+# --- Hilfsfunktionen ---
+# 1:
+def pack_rows(rows, width):
+    """Packt Bitfolgen (Listen von 0/1) in eine (N x ceil(width/8)) uint8-Matrix, rechts mit 0 aufgefüllt."""
+    matrix = np.zeros((len(rows), width), dtype=np.uint8)
+    for i, bits in enumerate(rows):
+        m = min(len(bits), width)
+        matrix[i, :m] = bits[:m]
+    return np.packbits(matrix, axis=1)
+
+
+# 2:
+def prefix_masks(width):
+    """Maske der ersten m Bits für jedes m in 0..width, gepackt wie pack_rows."""
+    mask = np.tri(width + 1, width, k=-1, dtype=np.uint8)
+    return np.packbits(mask, axis=1)
+
+
+# --- Vektorisierter Scorer ---
+class BatchScorer:
+    """
+    Hält das ganze Lexikon als gepackte Bit-Matrix + Längenvektor und berechnet
+    alle Distanzen in einem vektorisierten Durchlauf.
+    Gleiche Semantik wie hamming_distance:
+        Fehler auf der gemeinsamen Länge + abs(len(a) - len(b))
+    """
+
+    def __init__(self, index):
+        # index: LexiconIndex (Phrasen sind dort bereits einmal kodiert)
+        self.phrases = [p for _, phrases in index.buckets.values() for p in phrases]
+        self.fingerprint = index.fingerprint
+        self.lengths = np.array([length for length, (codes, _) in index.buckets.items()
+                                 for _ in codes], dtype=np.int32)
+        self.width = int(self.lengths.max()) if len(self.phrases) else 0
+
+        # gepackte Integer bucketweise über ihre Binärdarstellung entpacken
+        bits = np.zeros((len(self.phrases), self.width), dtype=np.uint8)
+        row = 0
+        for length, (codes, _) in index.buckets.items():
+            if length:
+                text = "".join(format(code, f"0{length}b") for code in codes)
+                block = np.frombuffer(text.encode("ascii"), dtype=np.uint8) - ord("0")
+                bits[row:row + len(codes), :length] = block.reshape(len(codes), length)
+            row += len(codes)
+
+        self.matrix = np.packbits(bits, axis=1)
+        self.masks = prefix_masks(self.width)
+
+    def __len__(self):
+        return len(self.phrases)
+
+    def score_many(self, bit_seqs, chunk_size=16):
+        """
+        Distanzen vieler Bitfolgen gegen das ganze Lexikon.
+        Rückgabe: (len(bit_seqs) x len(lexikon)) int32-Matrix.
+        chunk_size begrenzt den Speicher der Zwischenmatrix (chunk x N x Bytes).
+        """
+        queries = pack_rows(bit_seqs, self.width)
+        n = np.array([len(b) for b in bit_seqs], dtype=np.int32)
+        out = np.empty((len(bit_seqs), len(self.phrases)), dtype=np.int32)
+
+        for start in range(0, len(bit_seqs), chunk_size):
+            stop = start + chunk_size
+            q, nq = queries[start:stop], n[start:stop]
+            # nur die gemeinsame Länge min(n, L) wird verglichen
+            common = np.minimum(self.lengths[None, :], nq[:, None])
+            diff = (self.matrix[None, :, :] ^ q[:, None, :]) & self.masks[common]
+            out[start:stop] = _POPCOUNT[diff].sum(axis=2, dtype=np.int32)
+            out[start:stop] += np.abs(self.lengths[None, :] - nq[:, None])
+        return out
+
+    def score(self, bits):
+        """Distanzen einer Bitfolge gegen das ganze Lexikon (int32-Vektor)."""
+        return self.score_many([bits])[0]
+
+    def top_k(self, dists, beam_size=10):
+        """
+        Die beam_size besten Einträge eines Distanzvektors via argpartition.
+        Gleichstände werden wie bei heapq.nsmallest über die Phrase aufgelöst.
+        """
+        if len(dists) == 0:
+            return []
+        k = min(beam_size, len(dists))
+        kth = dists[np.argpartition(dists, k - 1)[:k]].max()
+        candidates = np.flatnonzero(dists <= kth)
+        best = sorted((int(dists[i]), self.phrases[i]) for i in candidates)[:k]
+        return [(w, d) for d, w in best]
+
+    def nearest(self, bits, beam_size=10, distance="hamming", max_dist=None):
+        """Die beam_size nächstliegenden Phrasen (höchstens max_dist entfernt) als Liste von (Phrase, Distanz)."""
+        if distance != "hamming":
+            raise ValueError(f"{type(self).__name__} unterstützt nur distance='hamming', nicht {distance!r}")
+        return [(w, d) for w, d in self.top_k(self.score(bits), beam_size) if max_dist is None or d <= max_dist]
+
+    def nearest_many(self, bit_seqs, beam_size=10, chunk_size=16):
+        """nearest() für viele Bitfolgen auf einmal, z.B. zum erneuten Dekodieren archivierter Aufnahmen."""
+        results = []
+        for start in range(0, len(bit_seqs), chunk_size):
+            dists = self.score_many(bit_seqs[start:start + chunk_size], chunk_size)
+            results.extend(self.top_k(row, beam_size) for row in dists)
+        return results
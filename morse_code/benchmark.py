@@ -0,0 +1,219 @@
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import time
+
+from .lazy_lexicon import LazyLexicon
+from .lexicon_index import LexiconIndex
+from .morse import BASE_WORDS, MORSE_TABLE, expand_lexicon
+from .profiling import percentile
+from .state_estimation import Debouncer, TimedDebouncer
+
+
+SEED = 13
+WORD_COUNTS = (19, 200, 2000)       # 19 = BASE_WORDS, danach synthetische Wörter
+MAX_LENS = (2, 3, 4, 5)
+MAX_LAZY_PHRASES = 10_000_000       # größere Lexika werden übersprungen
+MAX_INDEX_PHRASES = 200_000         # LexiconIndex nur bis zu dieser Größe bauen
+QUERIES = 50
+TIME_BUDGET = 10.0                  # Sekunden pro Konfiguration und Backend
+DEBOUNCE_FRAMES = 2_000_000
+
+
+# --- Testdaten (reproduzierbar über SEED) ---
+def make_words(n, seed=SEED):
+    """BASE_WORDS, aufgefüllt mit zufälligen Wörtern (3-7 Buchstaben) bis n Wörter."""
+    rng = random.Random(seed)
+    words = sorted(BASE_WORDS)
+    seen = set(words)
+    while len(words) < n:
+        word = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(rng.randint(3, 7)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words[:n]
+
+
+def make_queries(words, max_len, count, seed=SEED):
+    """Bitfolgen zufälliger Phrasen mit 0-2 gekippten Bits (wie Erkennungsfehler im Video)."""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        phrase = rng.sample(words, rng.randint(1, min(max_len, len(words))))
+        bits = [b for word in phrase for ch in word for b in MORSE_TABLE[ch]]
+        for _ in range(rng.randint(0, 2)):
+            i = rng.randrange(len(bits))
+            bits[i] ^= 1
+        queries.append(bits)
+    return queries
+
+
+def make_frames(n, seed=SEED):
+    """n Frame-Zustände: Segmente aus 1/0/-1 mit 1-60 Frames, wie bei echten Gesten."""
+    rng = random.Random(seed)
+    frames = []
+    while len(frames) < n:
+        frames.extend([rng.choice((1, 0, -1))] * rng.randint(1, 60))
+    return frames[:n]
+
+
+# --- Messungen ---
+def time_queries(lexicon, queries, budget=TIME_BUDGET):
+    """Fragt lexicon.nearest() nacheinander ab, bis alle Anfragen oder das Zeitbudget verbraucht sind."""
+    latencies = []
+    start = time.perf_counter()
+    for bits in queries:
+        t = time.perf_counter()
+        lexicon.nearest(bits)
+        latencies.append(time.perf_counter() - t)
+        if time.perf_counter() - start > budget:
+            break
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "queries": len(latencies),
+        "qps": len(latencies) / total if total else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+    }
+
+
+def bench_decode(word_counts=WORD_COUNTS, max_lens=MAX_LENS, queries=QUERIES, budget=TIME_BUDGET,
+                 max_index_phrases=MAX_INDEX_PHRASES, max_lazy_phrases=MAX_LAZY_PHRASES):
+    """Durchsatz und Latenz der Dekodierung für wachsende Lexika (Backends: index, lazy)."""
+    results = []
+    for n in word_counts:
+        words = make_words(n)
+        for max_len in max_lens:
+            phrases = sum(math.perm(n, k) for k in range(1, min(max_len, n) + 1))
+            if phrases > max_lazy_phrases:
+                continue
+            query_bits = make_queries(words, max_len, queries)
+            entry = {"words": n, "max_len": max_len, "phrases": phrases}
+
+            if phrases <= max_index_phrases:
+                t = time.perf_counter()
+                index = LexiconIndex(expand_lexicon(words, MORSE_TABLE, max_len), MORSE_TABLE)
+                build = time.perf_counter() - t
+                results.append({**entry, "backend": "index", "build_s": build,
+                                **time_queries(index, query_bits, budget)})
+                print(_format(results[-1]))
+                del index
+
+            lazy = LazyLexicon(words, MORSE_TABLE, max_len)
+            results.append({**entry, "backend": "lazy", **time_queries(lazy, query_bits, budget)})
+            print(_format(results[-1]))
+    return results
+
+
+def bench_debounce(n=DEBOUNCE_FRAMES):
+    """Frames pro Sekunde für Debouncer (Frames), TimedDebouncer (Sekunden, 30 fps) und, mit NumPy, debounce_rle."""
+    frames = make_frames(n)
+    timestamps = [i / 30 for i in range(n)]
+    results = []
+
+    debouncer = Debouncer()
+    push = debouncer.push
+    t = time.perf_counter()
+    for value in frames:
+        push(value)
+    elapsed = time.perf_counter() - t
+    results.append({"debouncer": "frames", "frames": n, "fps": n / elapsed})
+
+    debouncer = TimedDebouncer()
+    push = debouncer.push
+    t = time.perf_counter()
+    for value, timestamp in zip(frames, timestamps):
+        push(value, timestamp)
+    elapsed = time.perf_counter() - t
+    results.append({"debouncer": "seconds", "frames": n, "fps": n / elapsed})
+
+    try:
+        import numpy as np
+        from .rle_debounce import debounce_rle
+    except ImportError:   # NumPy fehlt: nur die beiden Debouncer messen
+        pass
+    else:
+        states = np.asarray(frames, dtype=np.int8)
+        t = time.perf_counter()
+        debounce_rle(states)
+        elapsed = time.perf_counter() - t
+        results.append({"debouncer": "rle", "frames": n, "fps": n / elapsed})
+
+    for entry in results:
+        print(_format(entry))
+    return results
+
+
+# --- Ergebnisse ---
+def _format(entry):
+    if "debouncer" in entry:
+        return f"Entprellung ({entry['debouncer']}): {entry['fps'] / 1e6:.2f} Mio. Frames/s"
+    return (f"{entry['backend']:>5}: {entry['words']:>5} Wörter, max_len {entry['max_len']}, "
+            f"{entry['phrases']:>9} Phrasen: {entry['qps']:8.1f} Anfragen/s, "
+            f"p50 {entry['p50_ms']:.2f} ms, p95 {entry['p95_ms']:.2f} ms")
+
+
+def _key(entry):
+    if "debouncer" in entry:
+        return ("debounce", entry["debouncer"]), "fps"
+    return ("decode", entry["backend"], entry["words"], entry["max_len"]), "qps"
+
+
+def environment():
+    """Commit, Python-Version und Rechner, damit Ergebnisse vergleichbar bleiben."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, cwd=os.path.dirname(__file__)).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "commit": commit or None,
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or None,
+        "cpus": os.cpu_count(),
+        "seed": SEED,
+    }
+
+
+def compare(results, baseline):
+    """Druckt das Verhältnis neu/alt (Durchsatz) für alle Einträge, die in beiden Läufen vorkommen."""
+    old = {}
+    for entry in baseline["decode"] + baseline["debounce"]:
+        key, metric = _key(entry)
+        old[key] = entry[metric]
+
+    print(f"\nVergleich mit {baseline['environment'].get('commit')}:")
+    for entry in results["decode"] + results["debounce"]:
+        key, metric = _key(entry)
+        if old.get(key):
+            print(f"  {' '.join(map(str, key)):<28} {entry[metric] / old[key]:6.2f}x")
+
+
+def run_benchmarks(output=None, baseline=None, quick=False, frames=DEBOUNCE_FRAMES, queries=QUERIES):
+    """
+    Komplette Suite; schreibt die Ergebnisse als JSON nach output und vergleicht
+    optional mit einer früheren Ergebnisdatei (baseline).
+    quick: kleine Lexika und weniger Frames für einen schnellen Lauf.
+    """
+    if quick:
+        decode = bench_decode(word_counts=(19, 200), max_lens=(2, 3), queries=queries, budget=2.0)
+        debounce = bench_debounce(min(frames, 200_000))
+    else:
+        decode = bench_decode(queries=queries)
+        debounce = bench_debounce(frames)
+
+    results = {"environment": environment(), "decode": decode, "debounce": debounce}
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nErgebnisse: {output}")
+    if baseline:
+        with open(baseline, encoding="utf-8") as f:
+            compare(results, json.load(f))
+    return results
@@ -0,0 +1,133 @@
+import bisect
+import math
+
+from .lexicon_index import edit_distance_packed, hamming_packed, pack_bits, pattern_masks, unpack_bits
+
+
+# --- Distanz-Funktionen auf gepackten Bitfolgen ---
+def distance_from(code, length, distance="hamming"):
+    """
+    Liefert f(code2, length2) = Distanz von (code, length) zu einer anderen gepackten Bitfolge.
+    Für Levenshtein werden die Myers-Masken nur einmal pro Ausgangsfolge berechnet.
+    """
+    if distance == "hamming":
+        return lambda other, other_len: hamming_packed(code, length, other, other_len)
+    if distance == "levenshtein":
+        peq = pattern_masks(unpack_bits(code, length))
+        return lambda other, other_len: edit_distance_packed(peq, length, other, other_len)
+    raise ValueError(f"Unbekannter Distanz-Modus: {distance!r}")
+
+
+# --- BK-Baum ---
+class BKNode:
+    """Knoten: gepackte Bitfolge, alle Phrasen mit genau dieser Bitfolge, Kinder nach Kantendistanz."""
+    __slots__ = ("code", "length", "phrases", "children")
+
+    def __init__(self, code, length, phrase):
+        self.code = code
+        self.length = length
+        self.phrases = [phrase]
+        self.children = {}
+
+
+class BKTree:
+    """
+    Metrischer Index (Burkhard-Keller-Baum) über die kodierten Phrasen.
+    Hamming mit Längenstrafe und Levenshtein sind beide Metriken, daher gilt die
+    Dreiecksungleichung: bei Anfrage-Distanz d zu einem Knoten kommen nur Kinder
+    mit Kantendistanz in [d - r, d + r] in Frage. Bei großen Lexika wird so nur
+    ein kleiner Teil der Phrasen angefasst (siehe self.visited).
+    Das gilt nur für kleine Radien: within(bits, 2) und search mit max_dist bzw. k = 1.
+    Für k = 10 ohne max_dist bleibt der Radius lange groß; bei 46 Bits und dem
+    Standard-Lexikon (99k Phrasen) werden rund 20-25 % der Phrasen berechnet, langsamer als
+    der Bucket-Scan von LexiconIndex. decode_with_lexicon_or_estimate sucht daher zuerst
+    mit max_dist=max_hamming. Der Aufbau mit distance='levenshtein' ist deutlich teurer als mit Hamming.
+    """
+
+    def __init__(self, index, distance="hamming"):
+        # index: LexiconIndex (Phrasen sind dort bereits gepackt)
+        self.distance = distance
+        self.root = None
+        self.size = 0
+        self.visited = 0  # Distanzberechnungen der letzten Anfrage
+        self.fingerprint = (index.fingerprint, distance)
+        for length, (codes, phrases) in index.buckets.items():
+            for code, phrase in zip(codes, phrases):
+                self.add(code, length, phrase)
+
+    def __len__(self):
+        return self.size
+
+    def add(self, code, length, phrase):
+        """Fügt eine gepackte Phrase ein (iterativ, ohne Rekursion)."""
+        self.size += 1
+        if self.root is None:
+            self.root = BKNode(code, length, phrase)
+            return
+        dist_to = distance_from(code, length, self.distance)
+        node = self.root
+        while True:
+            d = dist_to(node.code, node.length)
+            if d == 0 and node.length == length:
+                node.phrases.append(phrase)  # gleiche Bitfolge, z.B. verschiedene Wortgrenzen
+                return
+            child = node.children.get(d)
+            if child is None:
+                node.children[d] = BKNode(code, length, phrase)
+                return
+            node = child
+
+    def within(self, bits, max_dist):
+        """Alle Phrasen mit Distanz <= max_dist als sortierte Liste von (Distanz, Phrase)."""
+        dist_to = distance_from(pack_bits(bits), len(bits), self.distance)
+        found = []
+        self.visited = 0
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            d = dist_to(node.code, node.length)
+            self.visited += 1
+            if d <= max_dist:
+                found.extend((d, phrase) for phrase in node.phrases)
+            for edge, child in node.children.items():
+                if d - max_dist <= edge <= d + max_dist:
+                    stack.append(child)
+        return sorted(found)
+
+    def search(self, bits, beam_size=10, max_dist=None):
+        """
+        k-nächste Nachbarn: Radius schrumpft auf den schlechtesten Eintrag im vollen Beam.
+        Ergebnis identisch zu LexiconIndex.search: Liste von (Distanz, Phrase).
+        """
+        dist_to = distance_from(pack_bits(bits), len(bits), self.distance)
+        beam = []
+        self.visited = 0
+
+        def radius():
+            r = math.inf if max_dist is None else max_dist
+            return min(r, beam[-1][0]) if len(beam) == beam_size else r
+
+        # Stack aus (untere Schranke für den Teilbaum, Knoten)
+        stack = [(0, self.root)] if self.root else []
+        while stack:
+            bound, node = stack.pop()
+            if bound > radius():
+                continue  # Radius ist seit dem Ablegen geschrumpft
+            d = dist_to(node.code, node.length)
+            self.visited += 1
+            for phrase in node.phrases:
+                if d <= radius():
+                    bisect.insort(beam, (d, phrase))
+                    del beam[beam_size:]
+            r = radius()
+            # nähere Kanten zuletzt auf den Stack -> zuerst besucht, Radius schrumpft schneller
+            for edge in sorted(node.children, key=lambda e: -abs(e - d)):
+                if abs(edge - d) <= r:
+                    stack.append((abs(edge - d), node.children[edge]))
+        return beam
+
+    def nearest(self, bits, beam_size=10, distance="hamming", max_dist=None):
+        """Die beam_size nächstliegenden Phrasen (höchstens max_dist entfernt) als Liste von (Phrase, Distanz)."""
+        if distance != self.distance:
+            raise ValueError(f"BKTree wurde für distance={self.distance!r} gebaut, nicht {distance!r}")
+        return [(w, d) for d, w in self.search(bits, beam_size, max_dist)]
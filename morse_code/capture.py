@@ -0,0 +1,340 @@
+import time
+from collections import deque
+
+import cv2
+
+from .profiling import stage
+from .state_estimation import STABLE_MIN_FRAMES
+
+
+HANDS_SETTINGS = {
+    "static_image_mode": False,
+    "max_num_hands": 1,
+    "min_detection_confidence": 0.7,
+    "min_tracking_confidence": 0.5,
+}
+
+SKIP_STEP = 4          # bei stabiler Hand nur jeden SKIP_STEP-ten Frame durch MediaPipe
+SKIP_MIN_MARGIN = 0.03 # Mindestabstand Fingerspitze/Mittelgelenk (Bildhöhe), sonst "Wechsel naht"
+
+ROI_PADDING = 0.6      # Rand um die Hand, relativ zur Seitenlänge ihres Rahmens
+ROI_SIZE = 256         # Ausschnitt wird auf höchstens ROI_SIZE Pixel Seitenlänge verkleinert
+
+
+# --- MediaPipe / Video ---
+def create_hands(**settings):
+    """MediaPipe Hands initialisieren (lädt das Modell, daher erst bei Bedarf aufrufen)."""
+    import mediapipe as mp   # schwerer Import, nicht beim Laden des Pakets
+
+    return mp.solutions.hands.Hands(**{**HANDS_SETTINGS, **settings})
+
+
+def open_video(video_path):
+    """Öffnet eine Video-Datei; Fehler, wenn sie nicht lesbar ist."""
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise FileNotFoundError(f"Video konnte nicht geöffnet werden: {video_path}")
+    return cap
+
+
+def is_hand_open(hand_landmarks):
+    """Einfacher Heuristik-Ansatz: Ist die Hand offen?"""
+    tips_ids = [8, 12, 16, 20]  # Fingerspitzen
+    for tip_id in tips_ids:
+        if hand_landmarks.landmark[tip_id].y > hand_landmarks.landmark[tip_id - 2].y:
+            return False  # Mindestens ein Finger nicht ausgestreckt
+    return True
+
+
+def open_source(source):
+    """Kamera-Index (z.B. 0 oder "0") oder Stream-URL (rtsp://...) öffnen."""
+    if isinstance(source, str) and source.isdigit():
+        source = int(source)
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise FileNotFoundError(f"Quelle konnte nicht geöffnet werden: {source}")
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # keine alten Frames im Treiber puffern
+    return cap
+
+
+def open_margin(hand_landmarks):
+    """
+    Kleinster Abstand (in Bildhöhe) zwischen Fingerspitze und Mittelgelenk:
+    >= 0 heißt offen (wie is_hand_open), Werte nahe 0 heißen "Zustand kippt gleich".
+    """
+    return min(hand_landmarks.landmark[tip_id - 2].y - hand_landmarks.landmark[tip_id].y
+               for tip_id in (8, 12, 16, 20))
+
+
+# --- Region of Interest ---
+class RoiHands:
+    """
+    Hülle um MediaPipe Hands: wertet nur einen Ausschnitt um die Hand des vorigen Frames aus
+    (gepolstert, quadratisch, auf ROI_SIZE verkleinert). Die Landmarken werden zurück in
+    Koordinaten des ganzen Bildes umgerechnet, is_hand_open sieht also dieselben Werte.
+    Ist die Hand im Ausschnitt verloren, wird derselbe Frame komplett ausgewertet.
+    """
+
+    def __init__(self, hands, padding=ROI_PADDING, size=ROI_SIZE, rgb=False):
+        self.hands = hands
+        self.padding = padding
+        self.size = size
+        self.rgb = rgb     # Frames schon RGB (ingest.IngestReader), keine Farbumwandlung
+        self.box = None    # (x0, y0, x1, y1) in Pixeln oder None = ganzes Bild
+
+    def process_frame(self, frame):
+        """BGR-Frame (RGB bei rgb=True) -> MediaPipe-Ergebnis mit Landmarken im ganzen Bild."""
+        height, width = frame.shape[:2]
+        if self.box is not None:
+            x0, y0, x1, y1 = self.box
+            with stage("roi_crop"):
+                crop = frame[y0:y1, x0:x1]
+                scale = self.size / max(x1 - x0, y1 - y0)
+                if scale < 1:
+                    crop = cv2.resize(crop, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            image = crop if self.rgb else self._convert(crop)
+            with stage("hands_process"):
+                results = self.hands.process(image)
+            if results.multi_hand_landmarks:
+                for hand_landmarks in results.multi_hand_landmarks:
+                    for lm in hand_landmarks.landmark:
+                        lm.x = (x0 + lm.x * (x1 - x0)) / width
+                        lm.y = (y0 + lm.y * (y1 - y0)) / height
+                        lm.z = lm.z * (x1 - x0) / width   # z ist wie x skaliert
+                self._track(results, width, height)
+                return results
+            self.box = None   # Spur verloren: ganzes Bild
+
+        image = frame if self.rgb else self._convert(frame)
+        with stage("hands_process"):
+            results = self.hands.process(image)
+        self._track(results, width, height)
+        return results
+
+    @staticmethod
+    def _convert(image):
+        with stage("color_convert"):
+            return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+    def _track(self, results, width, height):
+        """Neuen Ausschnitt aus den Landmarken der ersten Hand bestimmen."""
+        if not results.multi_hand_landmarks:
+            self.box = None
+            return
+        landmarks = results.multi_hand_landmarks[0].landmark
+        xs = [lm.x * width for lm in landmarks]
+        ys = [lm.y * height for lm in landmarks]
+        side = max(max(xs) - min(xs), max(ys) - min(ys)) * (1 + 2 * self.padding)
+        cx, cy = (max(xs) + min(xs)) / 2, (max(ys) + min(ys)) / 2
+
+        x0, y0 = max(int(cx - side / 2), 0), max(int(cy - side / 2), 0)
+        x1, y1 = min(int(cx + side / 2) + 1, width), min(int(cy + side / 2) + 1, height)
+        self.box = (x0, y0, x1, y1) if x1 - x0 > 1 and y1 - y0 > 1 else None
+
+    def close(self):
+        self.hands.close()
+
+
+class RgbHands:
+    """Hülle um MediaPipe Hands für Frames, die schon RGB sind (ingest.IngestReader)."""
+
+    def __init__(self, hands):
+        self.hands = hands
+
+    def process_frame(self, frame):
+        with stage("hands_process"):
+            return self.hands.process(frame)
+
+    def close(self):
+        self.hands.close()
+
+
+# --- Frame-Analyse ---
+def read_frames(cap, timestamps=None):
+    """
+    Liefert die BGR-Frames eines geöffneten Videos.
+    timestamps: optionale Warteschlange, erhält pro Frame seinen Zeitstempel in Sekunden.
+    """
+    while cap.isOpened():
+        with stage("video_decode"):
+            success, frame = cap.read()
+        if not success:
+            break
+        if timestamps is not None:
+            timestamps.append(frame_time(cap))
+        yield frame
+
+
+def frame_time(cap):
+    """Zeitstempel des zuletzt gelesenen Frames in Sekunden (laut Container, auch bei variabler Bildrate)."""
+    return cap.get(cv2.CAP_PROP_POS_MSEC) / 1000
+
+
+def with_timestamps(states, timestamps):
+    """Zustände mit den Zeitstempeln aus read_frames paaren (ein Zustand pro gelesenem Frame)."""
+    for state in states:
+        yield state, timestamps.popleft()
+
+
+def analyse_frame(frame, hands):
+    """Ein BGR-Frame -> (Zustand, Abstand); Abstand ist None, wenn keine Hand erkannt wurde."""
+    if hasattr(hands, "process_frame"):  # RoiHands: erst zuschneiden, dann Farbe umwandeln; RgbHands: schon RGB
+        results = hands.process_frame(frame)
+    else:
+        with stage("color_convert"):
+            image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        with stage("hands_process"):
+            results = hands.process(image)
+
+    if results.multi_hand_landmarks:
+        hand_landmarks = results.multi_hand_landmarks[0]
+        with stage("is_hand_open"):
+            state = 1 if is_hand_open(hand_landmarks) else 0
+        return state, open_margin(hand_landmarks)
+    return -1, None  # -1 als Trenner für neue Zeile/Sequenz
+
+
+def classify_frame(frame, hands):
+    """Ein BGR-Frame -> 1 (Hand offen), 0 (Hand geschlossen) oder -1 (keine Hand)."""
+    return analyse_frame(frame, hands)[0]
+
+
+def frame_states(cap, hands, step=1, stats=None, timed=False, reader=None):
+    """
+    Liefert pro Frame 1 (Hand offen), 0 (Hand geschlossen) oder -1 (keine Hand);
+    timed: stattdessen (Zustand, Zeitstempel in s) für TimedDebouncer.
+    stats: optionales dict, erhält "frames", "inferences" und "seconds" (Zeit in MediaPipe).
+    reader: optionaler ingest.IngestReader statt cap.read im selben Thread (RGB-Frames,
+    hands muss dazu passen, z.B. RgbHands).
+    """
+    timestamps = deque() if timed else None
+    frames = reader.frames(timestamps) if reader is not None else read_frames(cap, timestamps)
+    if step > 1:
+        states = adaptive_states(frames, hands, step, stats=stats)
+    else:
+        states = classify_frames(frames, hands, stats)
+
+    if timed:
+        yield from with_timestamps(states, timestamps)
+    else:
+        yield from states
+
+
+def classify_frames(frames, hands, stats=None):
+    """classify_frame für jeden Frame, mit Zeitmessung in stats."""
+    stats = {} if stats is None else stats
+    stats["frames"] = stats["inferences"] = stats["seconds"] = 0
+    for frame in frames:
+        start = time.perf_counter()
+        state = classify_frame(frame, hands)
+        stats["seconds"] += time.perf_counter() - start
+        stats["frames"] += 1
+        stats["inferences"] += 1
+        yield state
+
+
+# --- Adaptive Unterabtastung ---
+def adaptive_states(frames, hands, step=SKIP_STEP, min_margin=SKIP_MIN_MARGIN,
+                    min_run=STABLE_MIN_FRAMES, stats=None):
+    """
+    Wie frame_states, aber MediaPipe läuft nur auf jedem step-ten Frame, solange
+    1: der Zustand schon min_run Frames hält (das Bit also feststeht),
+    2: eine Hand zu sehen ist und
+    3: die Finger deutlich offen bzw. geschlossen sind (|open_margin| >= min_margin).
+    Sonst wird wieder jeder Frame ausgewertet.
+    Übersprungene Frames werden gepuffert: Ist der nächste ausgewertete Frame im selben
+    Zustand, erhalten sie diesen Zustand; sonst werden sie nachträglich einzeln ausgewertet.
+    Pro Eingabe-Frame wird genau ein Zustand geliefert, die Schwellen der Entprellung
+    (in Frames) gelten daher unverändert.
+    Identische Bits wie bei jedem Frame, solange step <= GAP_TOLERANCE ist und kein
+    offener/geschlossener Zustand kürzer als step Frames flackert (prüfen: bits --verify).
+    stats: optionales dict, erhält "frames", "inferences" und "seconds".
+    """
+    stats = {} if stats is None else stats
+    stats["frames"] = stats["inferences"] = stats["seconds"] = 0
+    last_state = None
+    run = 0
+    skipping = False
+    skipped = []
+
+    def infer(frame):
+        start = time.perf_counter()
+        result = analyse_frame(frame, hands)
+        stats["seconds"] += time.perf_counter() - start
+        stats["inferences"] += 1
+        return result
+
+    def emit(state):
+        nonlocal last_state, run
+        stats["frames"] += 1
+        run = run + 1 if state == last_state else 1
+        last_state = state
+        return state
+
+    for frame in frames:
+        if skipping and len(skipped) < step - 1:
+            skipped.append(frame)
+            continue
+
+        state, margin = infer(frame)
+        if skipped:
+            if state == last_state:
+                filled = [state] * len(skipped)
+            else:
+                # Wechsel innerhalb der Lücke: exakt nachrechnen
+                filled = [infer(f)[0] for f in skipped]
+            for s in filled:
+                yield emit(s)
+            skipped.clear()
+
+        yield emit(state)
+        skipping = state != -1 and run >= min_run and abs(margin) >= min_margin
+
+    # Video endet mitten in einer Lücke
+    for frame in skipped:
+        yield emit(infer(frame)[0])
+
+
+def stream_frame_states(video_path, step=1, stats=None, roi=False, timed=False, ingest=False, decode_width=None,
+                        **settings):
+    """
+    Generator über die Frame-Zustände eines Videos; Video und Modell werden am Ende freigegeben.
+    step > 1: adaptive Unterabtastung (siehe adaptive_states); roi: nur Ausschnitt um die Hand;
+    timed: (Zustand, Zeitstempel)-Paare;
+    ingest: Lesen im eigenen Thread mit wiederverwendeten RGB-Puffern (ingest.IngestReader),
+    decode_width: dabei auf diese Breite verkleinern. stats erhält dann zusätzlich
+    "decoded", "decode_seconds" und "decode_fps".
+    """
+    cap = open_video(video_path)
+    hands = create_hands(**settings)
+    reader = None
+    if ingest:
+        from .ingest import IngestReader
+
+        reader = IngestReader(cap, decode_width, hold=step)
+        hands = RoiHands(hands, rgb=True) if roi else RgbHands(hands)
+    elif roi:
+        hands = RoiHands(hands)
+    try:
+        yield from frame_states(cap, hands, step, stats, timed, reader)
+    finally:
+        if reader is not None:
+            reader.stop()
+            if stats is not None:
+                stats.update(reader.stats, decode_fps=reader.decode_fps)
+        cap.release()
+        hands.close()
+
+
+def read_frame_states(video_path, **settings):
+    """Analysiert ein ganzes Video und gibt die Liste der Frame-Zustände zurück."""
+    return list(stream_frame_states(video_path, **settings))
+
+
+def frame_rate(video_path):
+    """Bildrate eines Videos laut Container."""
+    cap = open_video(video_path)
+    try:
+        return cap.get(cv2.CAP_PROP_FPS)
+    finally:
+        cap.release()
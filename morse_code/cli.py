@@ -0,0 +1,372 @@
+import argparse
+
+from .decoder import (LEXICON_MAX_LEN, LEXICON_PATH, decode_with_lexicon_or_estimate, decode_with_score,
+                      default_lexicon_index)
+from .morse import MORSE_TABLE
+from .profiling import PROFILER, enable
+from .state_estimation import (GAP_TOLERANCE, GAP_TOLERANCE_SECONDS, REFERENCE_FPS, STABLE_MIN_FRAMES,
+                               STABLE_MIN_SECONDS, stream_bits, stream_bits_timed)
+
+
+# --- Einstiegspunkte (auch von den Skripten im Hauptordner genutzt) ---
+def run_bits(video_path, stable_min_frames=STABLE_MIN_FRAMES, gap_tolerance=GAP_TOLERANCE, threaded=False,
+             step=1, roi=False, timing="seconds", stable_min_seconds=STABLE_MIN_SECONDS,
+             gap_tolerance_seconds=GAP_TOLERANCE_SECONDS, cache=False, rule="tips", ingest=False, decode_width=None):
+    """
+    Video analysieren und die finale Bitfolge ausgeben.
+    threaded: Lesen/Inferenz/Entprellung parallel; step > 1: adaptive Unterabtastung;
+    roi: MediaPipe nur auf einem Ausschnitt um die Hand;
+    timing: 'seconds' (Zeitstempel der Frames, unabhängig von der Bildrate) oder 'frames';
+    cache: Landmarken aus dem Landmark-Cache abspielen (beim ersten Mal aufzeichnen);
+    rule: mit cache die Regel für offen/geschlossen ("tips" wie is_hand_open, "angles" drehungsunabhängig);
+    ingest: Lesen im eigenen Thread mit wiederverwendeten Puffern, decode_width: dabei verkleinern
+    (nicht mit threaded/cache).
+    """
+    from .capture import frame_rate, stream_frame_states
+    from .pipeline import threaded_video_bits
+
+    fps = frame_rate(video_path)
+    print(f"Frame rate: {fps}\n")
+    print(f"Video: {video_path} wird analysiert...\n")
+
+    timed = timing == "seconds"
+    if timed:
+        first_duration = 1 / (fps if fps > 0 else REFERENCE_FPS)
+
+        def bits_stage(samples):
+            return stream_bits_timed(samples, stable_min_seconds, gap_tolerance_seconds, first_duration)
+    else:
+        def bits_stage(states):
+            return stream_bits(states, stable_min_frames, gap_tolerance)
+
+    # Frames werden nicht gesammelt: jedes Bit steht fest, sobald sein Zustand stabil ist
+    final_sequence = []
+    stats = {}
+    if cache:
+        from .landmark_cache import cached_recording
+
+        recording = cached_recording(video_path)
+        bits = bits_stage(recording.samples(rule) if timed else recording.states(rule))
+    elif threaded:
+        bits = threaded_video_bits(video_path, stable_min_frames, gap_tolerance, step=step, roi=roi,
+                                   bits_stage=bits_stage, timed=timed)
+    else:
+        bits = bits_stage(stream_frame_states(video_path, step, stats, roi, timed, ingest, decode_width))
+
+    for bit in bits:
+        final_sequence.append(bit)
+        print("Bit:", bit)
+
+    print(f"\nvideo_path:{video_path}")
+    print("Finale Bitfolge:", final_sequence)
+    if stats.get("inferences"):
+        print(f"MediaPipe auf {stats['inferences']} von {stats['frames']} Frames, "
+              f"{stats['seconds'] / stats['inferences'] * 1000:.1f} ms pro Auswertung"
+              f"{' (ROI)' if roi else ''}")
+    if stats.get("decoded") and stats.get("seconds"):
+        print(f"Dekodierung: {stats['decode_fps']:.1f} Frames/s, "
+              f"Inferenz: {stats['inferences'] / stats['seconds']:.1f} Frames/s")
+    return final_sequence
+
+
+def run_verify_skip(video_path, step, stable_min_frames=STABLE_MIN_FRAMES, gap_tolerance=GAP_TOLERANCE):
+    """Prüft, ob die adaptive Unterabtastung dieselben Bits liefert wie die Auswertung jedes Frames."""
+    from .capture import stream_frame_states
+
+    full = list(stream_bits(stream_frame_states(video_path), stable_min_frames, gap_tolerance))
+    stats = {}
+    fast = list(stream_bits(stream_frame_states(video_path, step, stats), stable_min_frames, gap_tolerance))
+
+    same = full == fast
+    print(f"{video_path}: {'gleich' if same else 'VERSCHIEDEN'} "
+          f"(MediaPipe auf {stats['inferences']} von {stats['frames']} Frames)")
+    if not same:
+        print("  jeder Frame:", full)
+        print(f"  step={step}:  ", fast)
+    return same
+
+
+def run_decode(bits, max_hamming=2, distance="hamming", lexicon_path=LEXICON_PATH):
+    """Bitfolge dekodieren und das beste Wort ausgeben; liegt es weiter als max_hamming weg, als unsicher markiert."""
+    text, dist, _ = decode_with_score(bits, MORSE_TABLE, default_lexicon_index(lexicon_path), distance=distance)
+    if text is None:
+        print("\nKein Kandidat im Lexikon")
+        return text
+    note = "" if dist <= max_hamming else f" (unsicher: Distanz {dist} > {max_hamming})"
+    print(f"\nBeste Wort-Dekodierung: '{text}' oder '{text.lower()}'{note}")
+    return text
+
+
+def run_video(video_path, max_hamming=2, distance="hamming", lexicon_path=LEXICON_PATH, threaded=False,
+              step=1, roi=False, timing="seconds", cache=False, rule="tips", ingest=False, decode_width=None):
+    """Komplette Pipeline: Video -> Frame-Zustände -> Bitfolge -> Wort."""
+    bits = run_bits(video_path, threaded=threaded, step=step, roi=roi, timing=timing, cache=cache, rule=rule,
+                    ingest=ingest, decode_width=decode_width)
+    return run_decode(bits, max_hamming, distance, lexicon_path)
+
+
+def run_live(source, max_hamming=2, distance="hamming", lexicon_path=LEXICON_PATH,
+             stable_min_seconds=STABLE_MIN_SECONDS, gap_tolerance_seconds=GAP_TOLERANCE_SECONDS):
+    """Kamera/Stream live dekodieren (Bits und Wörter sofort ausgeben)."""
+    from . import live
+
+    return live.run_live(source, max_hamming, distance, lexicon_path, stable_min_seconds, gap_tolerance_seconds)
+
+
+def run_multi(source, num_hands=2, max_hamming=2, distance="hamming", lexicon_path=LEXICON_PATH,
+              stable_min_seconds=STABLE_MIN_SECONDS, gap_tolerance_seconds=GAP_TOLERANCE_SECONDS):
+    """Mehrere Signalgeber in einem Video/Stream getrennt dekodieren (Ausgabe pro Hand)."""
+    from . import multi
+
+    return multi.run_multi(source, num_hands, max_hamming, distance, lexicon_path,
+                           stable_min_seconds, gap_tolerance_seconds)
+
+
+def run_batch(pattern, output=None, workers=None, distance="hamming", lexicon_path=LEXICON_PATH,
+              stable_min_seconds=STABLE_MIN_SECONDS, gap_tolerance_seconds=GAP_TOLERANCE_SECONDS, cache=False,
+              rule="tips"):
+    """Ordner/Glob von Videos parallel auswerten (ein Prozess mit eigenem MediaPipe-Modell pro Worker)."""
+    from . import batch
+
+    return batch.run_batch(pattern, output, workers, stable_min_seconds, gap_tolerance_seconds, distance, lexicon_path,
+                           cache, rule)
+
+
+def run_clear_cache(video_path=None):
+    """Landmark-Cache leeren (ganz oder nur für ein Video)."""
+    from .landmark_cache import CACHE_DIR, clear_cache
+
+    removed = clear_cache(CACHE_DIR, video_path)
+    print(f"{removed} Cache-Einträge gelöscht")
+    return removed
+
+
+def run_compare_roi(video_path, stable_min_frames=STABLE_MIN_FRAMES, gap_tolerance=GAP_TOLERANCE):
+    """Inferenzzeit pro Frame und Bitfolge mit und ohne ROI-Ausschnitt vergleichen."""
+    from .capture import stream_frame_states
+
+    results = {}
+    for roi in (False, True):
+        stats = {}
+        bits = list(stream_bits(stream_frame_states(video_path, stats=stats, roi=roi),
+                                stable_min_frames, gap_tolerance))
+        results[roi] = bits
+        print(f"{'mit ROI ' if roi else 'ohne ROI'}: {stats['seconds'] / max(stats['inferences'], 1) * 1000:.1f} ms/Frame, "
+              f"Bits: {bits}")
+    print("Bitfolgen gleich" if results[False] == results[True] else "Bitfolgen VERSCHIEDEN")
+    return results
+
+
+def run_benchmark(output=None, baseline=None, quick=False, frames=None, queries=None):
+    """Benchmark-Suite für Dekodierung und Entprellung (Ergebnisse als JSON, optional Vergleich)."""
+    from . import benchmark
+
+    return benchmark.run_benchmarks(output, baseline, quick,
+                                    frames or benchmark.DEBOUNCE_FRAMES, queries or benchmark.QUERIES)
+
+
+def run_synthetic(texts, count=100, decode=False, lexicon_path=LEXICON_PATH, **stream_settings):
+    """Genauigkeit von Entprellung (und optional Dekodierung) auf synthetischen Gesten messen."""
+    from .synthetic import evaluate
+
+    decoder = None
+    if decode:
+        lexicon = default_lexicon_index(lexicon_path)
+
+        def decoder(bits):
+            return decode_with_lexicon_or_estimate(bits, MORSE_TABLE, lexicon, max_hamming=2)
+
+    result = evaluate(texts, count, decode=decoder, **stream_settings)
+    print(f"{result['runs']} Durchläufe, {result['frames']} Frames "
+          f"({result['frames_per_s'] / 1e3:.0f}k Frames/s Entprellung)")
+    print(f"Bitfolge exakt: {result['bits_exact'] * 100:.1f}%")
+    if result["words_exact"] is not None:
+        print(f"Wort richtig:   {result['words_exact'] * 100:.1f}%")
+    return result
+
+
+def parse_bits(text):
+    """'0000 0 01' oder '0,0,0' -> [0, 0, 0, ...]"""
+    return [int(ch) for ch in text if ch in "01"]
+
+
+# --- Kommandozeile ---
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m morse_code",
+                                     description="Morse-Code aus Handgesten erkennen und dekodieren.")
+    parser.add_argument("--profile", choices=["json", "prometheus"],
+                        help="Laufzeit pro Verarbeitungsschritt messen und in diesem Format ausgeben")
+    parser.add_argument("--profile-output", help="Messwerte in diese Datei statt auf die Konsole schreiben")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    decode_opts = argparse.ArgumentParser(add_help=False)
+    decode_opts.add_argument("--max-hamming", type=int, default=2)
+    decode_opts.add_argument("--distance", choices=["hamming", "levenshtein"], default="hamming")
+    decode_opts.add_argument("--lexicon", default=LEXICON_PATH, help="Pfad zum kompilierten Lexikon-Index")
+
+    p = sub.add_parser("video", parents=[decode_opts], help="Video analysieren und dekodieren")
+    p.add_argument("video_path")
+    p.add_argument("--threaded", action="store_true", help="Lesen, Inferenz und Entprellung in eigenen Threads")
+    p.add_argument("--skip", type=int, default=1, metavar="N",
+                   help="bei stabiler Hand nur jeden N-ten Frame auswerten (adaptive Unterabtastung)")
+    p.add_argument("--roi", action="store_true", help="MediaPipe nur auf einem Ausschnitt um die Hand")
+    p.add_argument("--timing", choices=["seconds", "frames"], default="seconds",
+                   help="Schwellen in Sekunden (Zeitstempel, unabhängig von der Bildrate) oder in Frames")
+    p.add_argument("--cache", action="store_true",
+                   help="Landmarken aus dem Landmark-Cache abspielen (erster Lauf zeichnet auf)")
+    p.add_argument("--rule", choices=["tips", "angles"], default="tips",
+                   help="mit --cache: Fingerspitzen über Mittelgelenk oder Gelenkwinkel (drehungsunabhängig)")
+    p.add_argument("--ingest", action="store_true",
+                   help="Video im eigenen Thread vorauslesen, RGB-Puffer wiederverwenden")
+    p.add_argument("--decode-width", type=int, metavar="PIXEL",
+                   help="mit --ingest: Frames auf diese Breite verkleinern")
+
+    p = sub.add_parser("bits", help="nur die finale Bitfolge eines Videos bestimmen")
+    p.add_argument("video_path")
+    p.add_argument("--stable-min-frames", type=int,
+                   help=f"nur mit --timing frames oder --verify (Standard {STABLE_MIN_FRAMES})")
+    p.add_argument("--gap-tolerance", type=int,
+                   help=f"nur mit --timing frames oder --verify (Standard {GAP_TOLERANCE})")
+    p.add_argument("--threaded", action="store_true", help="Lesen, Inferenz und Entprellung in eigenen Threads")
+    p.add_argument("--skip", type=int, default=1, metavar="N",
+                   help="bei stabiler Hand nur jeden N-ten Frame auswerten (adaptive Unterabtastung)")
+    p.add_argument("--roi", action="store_true", help="MediaPipe nur auf einem Ausschnitt um die Hand")
+    p.add_argument("--timing", choices=["seconds", "frames"], default="seconds",
+                   help="Schwellen in Sekunden (Zeitstempel, unabhängig von der Bildrate) oder in Frames")
+    p.add_argument("--cache", action="store_true",
+                   help="Landmarken aus dem Landmark-Cache abspielen (erster Lauf zeichnet auf)")
+    p.add_argument("--rule", choices=["tips", "angles"], default="tips",
+                   help="mit --cache: Fingerspitzen über Mittelgelenk oder Gelenkwinkel (drehungsunabhängig)")
+    p.add_argument("--ingest", action="store_true",
+                   help="Video im eigenen Thread vorauslesen, RGB-Puffer wiederverwenden")
+    p.add_argument("--decode-width", type=int, metavar="PIXEL",
+                   help="mit --ingest: Frames auf diese Breite verkleinern")
+    p.add_argument("--stable-min-seconds", type=float, default=STABLE_MIN_SECONDS)
+    p.add_argument("--gap-tolerance-seconds", type=float, default=GAP_TOLERANCE_SECONDS)
+    p.add_argument("--verify", action="store_true",
+                   help="mit --skip: Ergebnis mit der Auswertung jedes Frames vergleichen")
+
+    p = sub.add_parser("compare-roi", help="Inferenzzeit mit und ohne ROI-Ausschnitt vergleichen")
+    p.add_argument("video_path")
+
+    p = sub.add_parser("live", parents=[decode_opts], help="Kamera oder Stream live dekodieren")
+    p.add_argument("source", nargs="?", default="0", help="Kamera-Index oder Stream-URL (Standard: 0)")
+    p.add_argument("--stable-min-seconds", type=float, default=STABLE_MIN_SECONDS)
+    p.add_argument("--gap-tolerance-seconds", type=float, default=GAP_TOLERANCE_SECONDS)
+
+    p = sub.add_parser("multi", parents=[decode_opts], help="mehrere Signalgeber gleichzeitig dekodieren")
+    p.add_argument("source", nargs="?", default="0", help="Video-Datei, Kamera-Index oder Stream-URL (Standard: 0)")
+    p.add_argument("--hands", type=int, default=2, help="höchstens so viele Hände verfolgen")
+    p.add_argument("--stable-min-seconds", type=float, default=STABLE_MIN_SECONDS)
+    p.add_argument("--gap-tolerance-seconds", type=float, default=GAP_TOLERANCE_SECONDS)
+
+    p = sub.add_parser("batch", help="alle Videos eines Ordners/Glob-Musters parallel auswerten")
+    p.add_argument("pattern", help="Ordner oder Glob, z.B. Videos oder 'Videos/Hello*.mp4'")
+    p.add_argument("--output", help="Ergebnisse als JSON-Zeilen (eine pro Video)")
+    p.add_argument("--workers", type=int, help="Anzahl Prozesse (Standard: Anzahl CPUs)")
+    p.add_argument("--distance", choices=["hamming", "levenshtein"], default="hamming")
+    p.add_argument("--lexicon", default=LEXICON_PATH, help="Pfad zum kompilierten Lexikon-Index")
+    p.add_argument("--stable-min-seconds", type=float, default=STABLE_MIN_SECONDS)
+    p.add_argument("--gap-tolerance-seconds", type=float, default=GAP_TOLERANCE_SECONDS)
+    p.add_argument("--cache", action="store_true",
+                   help="Landmarken aus dem Landmark-Cache abspielen (erster Lauf zeichnet auf)")
+    p.add_argument("--rule", choices=["tips", "angles"], default="tips",
+                   help="mit --cache: Fingerspitzen über Mittelgelenk oder Gelenkwinkel (drehungsunabhängig)")
+
+    p = sub.add_parser("clear-cache", help="Landmark-Cache leeren")
+    p.add_argument("video_path", nargs="?", help="nur die Einträge dieses Videos löschen")
+
+    p = sub.add_parser("decode", parents=[decode_opts], help="eine Bitfolge dekodieren, z.B. 0000 0 0100")
+    p.add_argument("bits", nargs="+")
+
+    p = sub.add_parser("synthetic", help="Genauigkeit auf synthetischen Gesten-Streams messen")
+    p.add_argument("texts", nargs="+", help="Texte, z.B. HELLO HILFE")
+    p.add_argument("--count", type=int, default=100, help="Durchläufe pro Text")
+    p.add_argument("--fps", type=float, default=30.0)
+    p.add_argument("--jitter", type=float, default=0.1, help="relative Streuung der Haltedauer")
+    p.add_argument("--flicker", type=float, default=0.0, help="Flacker-Wahrscheinlichkeit pro Frame")
+    p.add_argument("--dropout", type=float, default=0.0, help="Handverlust-Wahrscheinlichkeit pro Bit")
+    p.add_argument("--drift", type=float, default=0.0, help="Tempo-Drift pro Bit")
+    p.add_argument("--seed", type=int)
+    p.add_argument("--decode", action="store_true", help="auch die Wort-Dekodierung prüfen")
+
+    p = sub.add_parser("benchmark", help="Durchsatz/Latenz von Dekodierung und Entprellung messen")
+    p.add_argument("--output", help="Ergebnisse als JSON speichern, z.B. bench-<commit>.json")
+    p.add_argument("--compare", metavar="BASELINE", help="mit einer früheren Ergebnisdatei vergleichen")
+    p.add_argument("--quick", action="store_true", help="kleine Lexika, weniger Frames")
+    p.add_argument("--frames", type=int, help="Anzahl Frames für die Entprellung")
+    p.add_argument("--queries", type=int, help="Anfragen pro Lexikon")
+
+    p = sub.add_parser("compile-lexicon", help="Lexikon-Index kompilieren (für schnellen Start)")
+    p.add_argument("--output", default=LEXICON_PATH)
+    p.add_argument("--max-len", type=int, default=LEXICON_MAX_LEN)
+    return parser
+
+
+def check_video_flags(parser, args):
+    """video/bits: Kombinationen ablehnen, bei denen ein Flag sonst stillschweigend ignoriert würde."""
+    if args.decode_width is not None and not args.ingest:
+        parser.error("--decode-width wirkt nur mit --ingest")
+    if args.ingest and (args.threaded or args.cache):
+        parser.error("--ingest ist nicht mit --threaded oder --cache kombinierbar")
+    if args.cache and (args.threaded or args.roi or args.skip != 1):
+        parser.error("--cache spielt aufgezeichnete Landmarken ab; --threaded, --roi und --skip wirken dort nicht")
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "rule", "tips") != "tips" and not args.cache:
+        parser.error(f"--rule {args.rule} wirkt nur auf aufgezeichnete Landmarken, bitte mit --cache verwenden")
+    if args.profile:
+        enable()
+
+    if args.command == "video":
+        check_video_flags(parser, args)
+        run_video(args.video_path, args.max_hamming, args.distance, args.lexicon, args.threaded, args.skip, args.roi,
+                  args.timing, args.cache, args.rule, args.ingest, args.decode_width)
+    elif args.command == "bits":
+        frame_thresholds = args.stable_min_frames is not None or args.gap_tolerance is not None
+        if frame_thresholds and args.timing == "seconds" and not args.verify:
+            parser.error("--stable-min-frames/--gap-tolerance gelten nur mit --timing frames; "
+                         "bei --timing seconds --stable-min-seconds/--gap-tolerance-seconds verwenden")
+        stable_min_frames = STABLE_MIN_FRAMES if args.stable_min_frames is None else args.stable_min_frames
+        gap_tolerance = GAP_TOLERANCE if args.gap_tolerance is None else args.gap_tolerance
+        if args.verify:
+            run_verify_skip(args.video_path, max(args.skip, 2), stable_min_frames, gap_tolerance)
+        else:
+            check_video_flags(parser, args)
+            run_bits(args.video_path, stable_min_frames, gap_tolerance, args.threaded, args.skip, args.roi,
+                     args.timing, args.stable_min_seconds, args.gap_tolerance_seconds, args.cache, args.rule,
+                     args.ingest, args.decode_width)
+    elif args.command == "compare-roi":
+        run_compare_roi(args.video_path)
+    elif args.command == "live":
+        run_live(args.source, args.max_hamming, args.distance, args.lexicon,
+                 args.stable_min_seconds, args.gap_tolerance_seconds)
+    elif args.command == "multi":
+        run_multi(args.source, args.hands, args.max_hamming, args.distance, args.lexicon,
+                  args.stable_min_seconds, args.gap_tolerance_seconds)
+    elif args.command == "batch":
+        run_batch(args.pattern, args.output, args.workers, args.distance, args.lexicon,
+                  args.stable_min_seconds, args.gap_tolerance_seconds, args.cache, args.rule)
+    elif args.command == "clear-cache":
+        run_clear_cache(args.video_path)
+    elif args.command == "decode":
+        run_decode(parse_bits(" ".join(args.bits)), args.max_hamming, args.distance, args.lexicon)
+    elif args.command == "synthetic":
+        run_synthetic(args.texts, args.count, args.decode, fps=args.fps, jitter=args.jitter,
+                      flicker=args.flicker, dropout=args.dropout, drift=args.drift, seed=args.seed)
+    elif args.command == "benchmark":
+        run_benchmark(args.output, args.compare, args.quick, args.frames, args.queries)
+    elif args.command == "compile-lexicon":
+        index = default_lexicon_index(args.output, args.max_len)
+        print(f"{args.output}: {len(index)} Phrasen")
+
+    if args.profile:
+        report = PROFILER.export(args.profile)
+        if args.profile_output:
+            with open(args.profile_output, "w", encoding="utf-8") as f:
+                f.write(report)
+        else:
+            print(report)
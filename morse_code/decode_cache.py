@@ -0,0 +1,97 @@
+import threading
+from collections import OrderedDict
+
+from .decoder import as_lexicon
+from .lexicon_index import pack_bits
+
+
+# --- Lexikon-Schlüssel ---
+def lexicon_key(lexicon):
+    """
+    Schlüssel für ein Lexikon-Objekt: Klasse + fingerprint (wird beim Bau einmal berechnet).
+    Objekte ohne fingerprint bekommen None und werden nicht gecacht.
+    """
+    fingerprint = getattr(lexicon, "fingerprint", None)
+    if fingerprint is None:
+        return None
+    return type(lexicon).__name__, fingerprint
+
+
+# --- LRU-Cache vor dem Decoder ---
+class DecodeCache:
+    """
+    Begrenzter LRU-Cache vor decode_with_lexicon_or_estimate.
+    Schlüssel: gepackte Bitfolge (Integer + Länge), max_hamming, beam_size,
+    Distanz-Modus und der Fingerprint des verwendeten Lexikons. Verschiedene Lexika
+    (LexiconIndex, LazyLexicon, SegmentDecoder, ...) teilen sich also keine Einträge.
+    lexicon=None steht für default_lexicon_index(); ändern sich BASE_WORDS oder MORSE_TABLE,
+    liefert dieser einen neuen Index mit neuem Fingerprint, alte Einträge laufen über
+    die LRU-Grenze aus. Reine Phrasenmengen werden abgelehnt (TypeError): sie müssten bei
+    jedem Aufruf neu zum Index gebaut und gehasht werden, also einmal vorab
+    LexiconIndex(phrases, morse_table) bauen und diesen übergeben.
+
+    Beispiel:
+        cached_decode = DecodeCache(decode_with_lexicon_or_estimate)
+        text = cached_decode(bits, MORSE_TABLE, LEXICON_INDEX, max_hamming=2)
+    """
+
+    def __init__(self, decode, maxsize=1024):
+        self.decode = decode
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __call__(self, bits, morse_table, lexicon, max_hamming=1, beam_size=10, distance="hamming"):
+        if lexicon is not None and not hasattr(lexicon, "nearest"):
+            raise TypeError("DecodeCache braucht ein fertiges Lexikon-Objekt (z.B. LexiconIndex) oder None, "
+                            f"keine Phrasenmenge vom Typ {type(lexicon).__name__}")
+        # Lexikon und Schlüssel außerhalb des Locks bestimmen; das aufgelöste Objekt
+        # wird auch zum Dekodieren verwendet
+        lexicon = as_lexicon(lexicon, morse_table)
+        lex_key = lexicon_key(lexicon)
+        if lex_key is None:
+            with self.lock:
+                self.uncached += 1
+            return self.decode(bits, morse_table, lexicon, max_hamming=max_hamming,
+                               beam_size=beam_size, distance=distance)
+
+        key = (pack_bits(bits), len(bits), max_hamming, beam_size, distance, lex_key)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+
+        # Dekodieren außerhalb des Locks, damit andere Threads nicht warten
+        result = self.decode(bits, morse_table, lexicon, max_hamming=max_hamming,
+                             beam_size=beam_size, distance=distance)
+
+        with self.lock:
+            self.entries[key] = result
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return result
+
+    def stats(self):
+        """Zähler für Monitoring: Treffer, Fehlschläge, Trefferquote, Größe, ungecachte Aufrufe."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "uncached": self.uncached,
+        }
@@ -0,0 +1,84 @@
+import os
+from functools import lru_cache
+
+from .lexicon_file import load_or_compile
+from .lexicon_index import LexiconIndex, lexicon_fingerprint
+from .morse import BASE_WORDS, MORSE_TABLE, bits_for_word
+from .profiling import stage
+
+
+# Cache-Verzeichnis des Benutzers statt Arbeitsverzeichnis (auch für den Landmark-Cache)
+CACHE_ROOT = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache")),
+                          "morse_code")
+LEXICON_PATH = os.path.join(CACHE_ROOT, "lexicon.idx")   # kompilierter Index (siehe lexicon_file)
+LEXICON_MAX_LEN = 4            # maximale Anzahl Wörter pro Phrase
+
+
+# --- Standard-Lexikon ---
+def default_lexicon_index(path=LEXICON_PATH, max_len=LEXICON_MAX_LEN):
+    """
+    Index über BASE_WORDS mit Phrasen bis max_len Wörtern.
+    Wird erst beim ersten Aufruf geladen (per mmap) bzw. kompiliert, nicht beim Import.
+    Ändern sich BASE_WORDS oder MORSE_TABLE, liefert der nächste Aufruf einen neuen Index.
+    """
+    return _compiled_index(path, max_len, lexicon_fingerprint(BASE_WORDS, MORSE_TABLE, max_len))
+
+
+@lru_cache(maxsize=8)
+def _compiled_index(path, max_len, fingerprint):
+    return load_or_compile(path, BASE_WORDS, MORSE_TABLE, max_len)
+
+
+def as_lexicon(lexicon, morse_table):
+    """Akzeptiert ein fertiges Lexikon-Objekt (mit nearest()), eine Phrasenmenge oder None (Standard-Index)."""
+    if lexicon is None:
+        return default_lexicon_index()
+    if not hasattr(lexicon, "nearest"):  # LexiconIndex, BatchScorer, LazyLexicon, BKTree, ...
+        return LexiconIndex(lexicon, morse_table)
+    return lexicon
+
+
+# --- Beam Search ---
+def decode_bits_beam(bits, morse_table=MORSE_TABLE, lexicon=None, beam_size=10, distance="hamming", max_dist=None):
+    """Sucht das nächstliegende Wort oder Phrase im Lexikon (mit max_dist nur bis zu dieser Distanz)."""
+    lexicon = as_lexicon(lexicon, morse_table)
+    with stage("lexicon_search"):
+        if max_dist is None:
+            return lexicon.nearest(bits, beam_size, distance=distance)
+        return lexicon.nearest(bits, beam_size, distance=distance, max_dist=max_dist)
+
+
+# --- Hauptfunktion ---
+def decode_with_lexicon_or_estimate(bits, morse_table=MORSE_TABLE, lexicon=None, max_hamming=1,
+                                    beam_size=10, distance="hamming", strict=False):
+    """
+    Bestes Wort bzw. beste Phrase: ein Lexikon-Treffer (Distanz <= max_hamming) oder,
+    wenn keiner so nah liegt, die nächstliegende Schätzung.
+    bits: Liste von 0/1
+    morse_table: dict {Buchstabe: Bitfolge}
+    lexicon: Menge an gültigen Wörtern, vorkompilierter Index oder None (Standard-Index)
+    distance: 'hamming' oder 'levenshtein' (Edit-Distanz: ein verlorenes/zusätzliches Bit kostet nur 1)
+    strict: nur Treffer zurückgeben; None, wenn kein Kandidat innerhalb von max_hamming liegt
+    Gibt None zurück, wenn das Lexikon gar keinen Kandidaten liefert (z.B. leeres Lexikon).
+    """
+    # Zuerst nur im Radius max_hamming suchen: Index und BK-Baum brechen dann früh ab
+    candidates = decode_bits_beam(bits, morse_table, lexicon, beam_size, distance, max_hamming)
+    if not candidates and not strict:
+        # Offene Schätzung: kein Treffer, also ohne Radius
+        candidates = decode_bits_beam(bits, morse_table, lexicon, beam_size, distance)
+    if not candidates:
+        return None
+    return candidates[0][0]
+
+
+def decode_with_score(bits, morse_table=MORSE_TABLE, lexicon=None, beam_size=10, distance="hamming"):
+    """
+    Bestes Wort wie decode_with_lexicon_or_estimate, aber als (Wort, Distanz, Genauigkeit in %);
+    ohne Kandidaten (None, Anzahl Bits, 0.0).
+    """
+    candidates = decode_bits_beam(bits, morse_table, lexicon, beam_size, distance)
+    if not candidates:
+        return None, len(bits), 0.0
+    word, dist = candidates[0]
+    acc = 1 - dist / max(len(bits), len(bits_for_word(word, morse_table)), 1)
+    return word, dist, round(acc * 100, 2)
@@ -0,0 +1,74 @@
+import math
+
+import numpy as np
+
+
+NUM_LANDMARKS = 21
+TIP_IDS = (8, 12, 16, 20)     # Fingerspitzen Zeige- bis kleiner Finger (Daumen wie is_hand_open nicht)
+PIP_IDS = (6, 10, 14, 18)     # Mittelgelenke (tip_id - 2)
+MCP_IDS = (5, 9, 13, 17)      # Grundgelenke
+DIP_IDS = (7, 11, 15, 19)     # Endgelenke
+
+MAX_BEND_DEGREES = 60.0       # Winkel-Regel: ab dieser Beugung gilt ein Finger als eingeklappt
+
+
+# --- Umwandlung ---
+def landmarks_array(hand_landmarks):
+    """MediaPipe-Hand -> (21, 3) float32 mit x/y/z; einmal umwandeln, danach nur noch Arrays."""
+    return np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32)
+
+
+def stack_hands(hands_list):
+    """Liste von MediaPipe-Händen -> (Frames, 21, 3) float32."""
+    if not hands_list:
+        return np.zeros((0, NUM_LANDMARKS, 3), dtype=np.float32)
+    return np.stack([landmarks_array(hand) for hand in hands_list])
+
+
+# --- Regeln ---
+def open_by_tips(landmarks, aspect=1.0):
+    """
+    Bisherige Regel, vektorisiert: offen, wenn bei keinem Finger die Spitze unter dem
+    Mittelgelenk liegt (y wächst nach unten). landmarks: (Frames, 21, 3) -> (Frames,) bool.
+    Gleiche Entscheidung wie is_hand_open, Frame für Frame. aspect wird nicht gebraucht
+    (nur y-Vergleiche), steht aber für eine gemeinsame Signatur in RULES.
+    """
+    y = np.asarray(landmarks)[..., 1]
+    return ~np.any(y[..., TIP_IDS] > y[..., PIP_IDS], axis=-1)
+
+
+def open_by_angles(landmarks, max_bend=MAX_BEND_DEGREES, aspect=1.0):
+    """
+    Drehungsunabhängige Regel: offen, wenn jeder Finger gestreckt ist, d.h. Grundglied
+    (Grund- -> Mittelgelenk) und Endglied (Endgelenk -> Spitze) höchstens max_bend Grad
+    auseinander zeigen. Eine zur Seite oder nach unten gedrehte offene Hand bleibt offen.
+    aspect: Bildbreite / Bildhöhe, damit x und y (normiert auf Breite bzw. Höhe) im selben
+    Maßstab verglichen werden; z ist wie x skaliert.
+    """
+    points = np.asarray(landmarks, dtype=np.float32) * np.array([aspect, 1.0, aspect], dtype=np.float32)
+    proximal = points[..., PIP_IDS, :] - points[..., MCP_IDS, :]
+    distal = points[..., TIP_IDS, :] - points[..., DIP_IDS, :]
+
+    dot = np.sum(proximal * distal, axis=-1)
+    norms = np.linalg.norm(proximal, axis=-1) * np.linalg.norm(distal, axis=-1)
+    # cos(Beugung) >= cos(max_bend) ohne Division; zusammenfallende Punkte zählen als gebeugt
+    extended = (dot >= math.cos(math.radians(max_bend)) * norms) & (norms > 0)
+    return np.all(extended, axis=-1)
+
+
+RULES = {
+    "tips": open_by_tips,
+    "angles": open_by_angles,
+}
+
+
+def classify_landmarks(landmarks, present=None, rule="tips", aspect=1.0):
+    """
+    Frame-Zustände eines ganzen Stapels in einem Schritt: 1 (offen), 0 (geschlossen),
+    -1 (keine Hand, present False). Gibt ein int8-Array zurück, passend für debounce_rle.
+    aspect: Bildbreite / Bildhöhe des Videos (siehe open_by_angles).
+    """
+    states = RULES[rule](landmarks, aspect=aspect).astype(np.int8)
+    if present is not None:
+        states[~np.asarray(present, dtype=bool)] = -1
+    return states
@@ -0,0 +1,155 @@
+import queue
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+from .capture import frame_time
+from .pipeline import _Failure
+from .profiling import stage
+
+
+DECODE_AHEAD = 8       # so viele Frames darf der Lese-Thread vorauslaufen
+
+
+# --- Puffer ---
+class FramePool:
+    """
+    Feste Anzahl vorab angelegter Frame-Puffer. acquire wartet, bis ein Puffer frei ist;
+    so entsteht pro Frame kein neues Array, und der Lese-Thread bremst von selbst,
+    wenn die Auswertung alle Puffer belegt.
+    """
+
+    def __init__(self, shape, count):
+        self.shape = shape
+        self._free = queue.Queue()
+        for _ in range(count):
+            self._free.put(np.empty(shape, dtype=np.uint8))
+
+    def acquire(self, timeout=None):
+        return self._free.get(timeout=timeout)
+
+    def release(self, buffer):
+        self._free.put(buffer)
+
+
+# --- Lesen ---
+class IngestReader:
+    """
+    Liest ein Video in einem eigenen Thread voraus: optional verkleinert (width, Seitenverhältnis
+    bleibt), direkt als RGB in Puffer eines FramePool (cv2.resize/cv2.cvtColor mit dst=, auch
+    cap.read schreibt in einen wiederverwendeten Puffer). Die Frames sind also schon RGB, für
+    MediaPipe ist keine weitere Umwandlung nötig (siehe capture.RgbHands).
+
+    hold: so viele zuvor gelieferte Frames darf der Verbraucher noch festhalten
+    (adaptive_states puffert bis zu step - 1 Frames); ältere Puffer werden wiederverwendet.
+    stats: "decoded" und "decode_seconds" (Lesen + Verkleinern + Farbumwandlung im Thread).
+    Eine Ausnahme im Lese-Thread wird wie in pipeline an den Verbraucher weitergereicht
+    und in frames() erneut ausgelöst.
+    """
+
+    def __init__(self, cap, width=None, hold=0, ahead=DECODE_AHEAD):
+        self.cap = cap
+        self.width = width
+        self.hold = hold
+        self.ahead = ahead
+        self.pool = None
+        self.stats = {"decoded": 0, "decode_seconds": 0.0}
+        self._queue = queue.Queue(maxsize=ahead)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        raw = None
+        small = None
+        try:
+            while not self._stop.is_set():
+                start = time.perf_counter()
+                with stage("video_decode"):
+                    success, raw = self.cap.read(raw) if raw is not None else self.cap.read()
+                if not success:
+                    break
+                timestamp = frame_time(self.cap)
+
+                image = raw
+                if self.width and raw.shape[1] > self.width:
+                    height = round(raw.shape[0] * self.width / raw.shape[1])
+                    if small is None:
+                        small = np.empty((height, self.width, 3), dtype=np.uint8)
+                    with stage("resize"):
+                        image = cv2.resize(raw, (self.width, height), dst=small, interpolation=cv2.INTER_AREA)
+
+                elapsed = time.perf_counter() - start
+
+                if self.pool is None:   # Größe erst nach dem ersten Frame bekannt
+                    self.pool = FramePool(image.shape, self.ahead + self.hold + 2)
+                buffer = self._acquire()   # Warten auf einen freien Puffer zählt nicht als Dekodierzeit
+                if buffer is None:
+                    break
+                start = time.perf_counter()
+                with stage("color_convert"):
+                    cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=buffer)
+
+                self.stats["decoded"] += 1
+                self.stats["decode_seconds"] += elapsed + time.perf_counter() - start
+                if not self._put((buffer, timestamp)):
+                    break
+        except BaseException as exc:
+            self._put(_Failure(exc), force=True)
+            return
+        self._put(None, force=True)
+
+    def _acquire(self):
+        while not self._stop.is_set():
+            try:
+                return self.pool.acquire(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+
+    def _put(self, item, force=False):
+        while force or not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                if force and self._stop.is_set():
+                    return False
+        return False
+
+    def frames(self, timestamps=None):
+        """
+        Liefert die RGB-Frames (Puffer aus dem Pool) wie capture.read_frames.
+        timestamps: optionale Warteschlange, erhält pro Frame seinen Zeitstempel in Sekunden.
+        """
+        held = deque()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                if isinstance(item, _Failure):
+                    raise item.exc
+                buffer, timestamp = item
+                if timestamps is not None:
+                    timestamps.append(timestamp)
+                held.append(buffer)
+                if len(held) > self.hold + 1:   # kein Verbraucher greift mehr darauf zu
+                    self.pool.release(held.popleft())
+                yield buffer
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Lese-Thread beenden und auf ihn warten; danach darf cap freigegeben werden."""
+        self._stop.set()
+        self._thread.join()   # ohne Timeout: ein laufendes cap.read muss fertig sein
+
+    @property
+    def decode_fps(self):
+        """Dekodierte Frames pro Sekunde Lese-Thread-Zeit (unabhängig von der Inferenz)."""
+        seconds = self.stats["decode_seconds"]
+        return self.stats["decoded"] / seconds if seconds else 0.0
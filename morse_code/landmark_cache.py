@@ -0,0 +1,192 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from .capture import HANDS_SETTINGS
+from .decoder import CACHE_ROOT
+from .hand_pose import NUM_LANDMARKS, classify_landmarks, landmarks_array
+
+
+CACHE_DIR = os.path.join(CACHE_ROOT, "landmarks")   # wie LEXICON_PATH unabhängig vom Arbeitsverzeichnis
+CACHE_VERSION = 2      # 2: mit Bildgröße (frame_size)
+
+
+# --- Hilfsfunktionen ---
+# 1:
+def file_hash(path, chunk_size=1 << 20):
+    """SHA-256 des Dateiinhalts (umbenannte/kopierte Videos treffen denselben Cache-Eintrag)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# 2:
+def tracker_settings(settings):
+    """Vollständige Hands-Einstellungen (Standard + Abweichungen), stabil serialisiert."""
+    return json.dumps({**HANDS_SETTINGS, **settings}, sort_keys=True)
+
+
+# 3:
+def cache_path(video_path, settings, cache_dir=CACHE_DIR):
+    """Cache-Datei für Video + Tracker-Einstellungen; andere Konfidenzwerte -> andere Datei."""
+    settings_hash = hashlib.sha256(tracker_settings(settings).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{file_hash(video_path)}-{settings_hash}.npz")
+
+
+class _Point:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+
+class _Hand:
+    """Bietet hand_landmarks.landmark[i].y wie MediaPipe, damit is_hand_open unverändert läuft."""
+    __slots__ = ("landmark",)
+
+    def __init__(self, row):
+        self.landmark = [_Point(*point) for point in row.tolist()]
+
+
+# --- Aufzeichnung ---
+class LandmarkRecording:
+    """
+    Landmarken aller Frames eines Videos:
+        landmarks:  (Frames, 21, 3) float32, x/y/z wie von MediaPipe (erste Hand)
+        present:    (Frames,) bool, Hand erkannt?
+        timestamps: (Frames,) float64, Sekunden (CAP_PROP_POS_MSEC)
+        frame_size: (Breite, Höhe) der Frames in Pixeln, für das Seitenverhältnis
+    Abspielen ersetzt Video-Dekodierung und hands.process; Klassifikation und
+    Entprellung laufen jedes Mal neu, Änderungen daran wirken also sofort.
+    """
+
+    def __init__(self, landmarks, present, timestamps, frame_size=(0, 0)):
+        self.landmarks = landmarks
+        self.present = present
+        self.timestamps = timestamps
+        self.frame_size = frame_size
+
+    def __len__(self):
+        return len(self.present)
+
+    @property
+    def aspect(self):
+        """Bildbreite / Bildhöhe (1.0, wenn die Größe unbekannt ist, z.B. ohne Frames)."""
+        width, height = self.frame_size
+        return width / height if width and height else 1.0
+
+    def state_array(self, rule="tips"):
+        """Alle Frame-Zustände auf einmal als int8-Array (siehe hand_pose.classify_landmarks)."""
+        return classify_landmarks(self.landmarks, self.present, rule, self.aspect)
+
+    def states(self, rule="tips"):
+        """
+        Frame-Zustände 1/0/-1 wie frame_states, aus den gespeicherten Landmarken.
+        rule: Name einer Regel aus hand_pose.RULES ("tips" = is_hand_open, "angles") oder eine
+        Funktion wie is_hand_open, die Frame für Frame auf einer MediaPipe-artigen Hand läuft.
+        """
+        if not callable(rule):
+            yield from self.state_array(rule).tolist()
+            return
+        for row, present in zip(self.landmarks, self.present):
+            if present:
+                yield 1 if rule(_Hand(row)) else 0
+            else:
+                yield -1
+
+    def samples(self, rule="tips"):
+        """(Zustand, Zeitstempel)-Paare für TimedDebouncer."""
+        return zip(self.states(rule), self.timestamps.tolist())
+
+
+def record(video_path, hands=None, **settings):
+    """Video einmal komplett durch MediaPipe schicken und alle Landmarken sammeln."""
+    from collections import deque
+
+    import cv2
+
+    from .capture import create_hands, open_video, read_frames
+
+    own_hands = hands is None
+    if own_hands:
+        hands = create_hands(**settings)
+    cap = open_video(video_path)
+
+    rows, present, timestamps = [], [], deque()
+    frame_size = (0, 0)
+    empty = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+    try:
+        for frame in read_frames(cap, timestamps):
+            frame_size = (frame.shape[1], frame.shape[0])
+            results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            if results.multi_hand_landmarks:
+                hand_landmarks = results.multi_hand_landmarks[0]
+                rows.append(landmarks_array(hand_landmarks))
+                present.append(True)
+            else:
+                rows.append(empty)
+                present.append(False)
+    finally:
+        cap.release()
+        if own_hands:
+            hands.close()
+
+    landmarks = np.stack(rows) if rows else np.zeros((0, NUM_LANDMARKS, 3), dtype=np.float32)
+    return LandmarkRecording(landmarks, np.array(present, dtype=bool), np.array(timestamps, dtype=np.float64),
+                             frame_size)
+
+
+# --- Schreiben / Laden ---
+def save_recording(recording, path, settings):
+    """Komprimiert als .npz speichern (atomar über eine Temp-Datei)."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        np.savez_compressed(f, landmarks=recording.landmarks, present=recording.present,
+                            timestamps=recording.timestamps, frame_size=np.array(recording.frame_size, dtype=np.int32),
+                            version=np.int32(CACHE_VERSION),
+                            settings=np.array(tracker_settings(settings)))
+    os.replace(tmp_path, path)
+
+
+def load_recording(path, settings):
+    """Lädt eine Aufzeichnung; None, wenn Version oder Tracker-Einstellungen nicht passen."""
+    with np.load(path) as data:
+        if int(data["version"]) != CACHE_VERSION or str(data["settings"]) != tracker_settings(settings):
+            return None
+        return LandmarkRecording(data["landmarks"], data["present"], data["timestamps"],
+                                 tuple(data["frame_size"].tolist()))
+
+
+def cached_recording(video_path, cache_dir=CACHE_DIR, refresh=False, hands=None, **settings):
+    """
+    Landmarken aus dem Cache laden oder einmal aufzeichnen und speichern.
+    refresh: Cache-Eintrag neu erzeugen; hands: vorhandenes MediaPipe-Objekt weiterverwenden
+    (muss zu settings passen).
+    """
+    path = cache_path(video_path, settings, cache_dir)
+    if not refresh and os.path.exists(path):
+        recording = load_recording(path, settings)
+        if recording is not None:
+            return recording
+
+    recording = record(video_path, hands, **settings)
+    save_recording(recording, path, settings)
+    return recording
+
+
+def clear_cache(cache_dir=CACHE_DIR, video_path=None):
+    """Löscht alle Cache-Einträge bzw. nur die eines Videos; gibt die Anzahl zurück."""
+    if not os.path.isdir(cache_dir):
+        return 0
+    prefix = file_hash(video_path) + "-" if video_path else ""
+    removed = 0
+    for name in os.listdir(cache_dir):
+        if name.startswith(prefix) and name.endswith(".npz"):
+            os.remove(os.path.join(cache_dir, name))
+            removed += 1
+    return removed
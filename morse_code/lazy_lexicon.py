@@ -0,0 +1,122 @@
+import bisect
+import itertools
+import math
+
+from .lexicon_index import lexicon_fingerprint
+
+
+# --- Lazy Lexikon ---
+class LazyLexicon:
+    """
+    Lexikon aller Phrasen aus 1..max_len verschiedenen Basiswörtern (wie expand_lexicon),
+    ohne die Phrasen zu speichern.
+    Gehalten werden nur die Morse-Bits der einzelnen Wörter; Phrasen und ihre
+    Bitfolgen werden bei Bedarf aus diesen zusammengesetzt.
+    Speicher ~ Anzahl Basiswörter, nicht Anzahl Phrasen.
+    """
+
+    def __init__(self, base_words, morse_table, max_len=4):
+        self.base_words = sorted(base_words)
+        self.max_len = max_len
+        self.fingerprint = lexicon_fingerprint(self.base_words, morse_table, max_len)
+        self.word_bits = {word: [b for ch in word if ch in morse_table for b in morse_table[ch]]
+                          for word in self.base_words}
+
+        # Wort-Bits einmal als (Integer, Länge) packen
+        self.word_codes = []
+        for word in self.base_words:
+            code = 0
+            for b in self.word_bits[word]:
+                code = (code << 1) | b
+            self.word_codes.append((word, code, len(self.word_bits[word])))
+
+    def __len__(self):
+        n = len(self.base_words)
+        return sum(math.perm(n, k) for k in range(1, min(self.max_len, n) + 1))
+
+    def __iter__(self):
+        for k in range(1, self.max_len + 1):
+            for combo in itertools.permutations(self.base_words, k):
+                yield " ".join(combo)
+
+    def __contains__(self, phrase):
+        words = phrase.split(" ")
+        return (1 <= len(words) <= self.max_len
+                and len(set(words)) == len(words)
+                and all(word in self.word_bits for word in words))
+
+    def length_range(self):
+        """(kürzeste, längste) Bitlänge aller Phrasen."""
+        lengths = sorted(length for _, _, length in self.word_codes)
+        if not lengths:
+            return (0, 0)
+        return (lengths[0], sum(lengths[-self.max_len:]))
+
+    def bits(self, phrase):
+        """Bitfolge einer Phrase aus den Wort-Bits zusammensetzen."""
+        seq = []
+        for word in phrase.split(" "):
+            seq.extend(self.word_bits[word])
+        return seq
+
+    def items(self):
+        """Erzeugt (Phrase, Bitfolge) für alle Phrasen, eine nach der anderen."""
+        for phrase in self:
+            yield phrase, self.bits(phrase)
+
+    def search(self, bits, beam_size=10, max_dist=None):
+        """
+        Tiefensuche über die Wortfolgen mit Branch-and-Bound.
+        Die Fehler im bisherigen Phrasen-Präfix (+ Überlänge) sind eine untere
+        Schranke für jede Verlängerung; Äste darüber werden nicht erzeugt.
+        Ergebnis identisch zu LexiconIndex.search: Liste von (Distanz, Phrase).
+        """
+        n = len(bits)
+        query = 0
+        for b in bits:
+            query = (query << 1) | b
+
+        beam = []
+        used = [False] * len(self.word_codes)
+        path = []
+
+        def prefix_errors(code, length):
+            # Fehler auf der gemeinsamen Länge + Überlänge über die Beobachtung hinaus
+            if length <= n:
+                return (code ^ (query >> (n - length))).bit_count()
+            return ((code >> (length - n)) ^ query).bit_count() + (length - n)
+
+        def worst():
+            if max_dist is not None and (len(beam) < beam_size or beam[-1][0] > max_dist):
+                return max_dist
+            return beam[-1][0] if len(beam) == beam_size else math.inf
+
+        def visit(code, length):
+            for i, (word, word_code, word_len) in enumerate(self.word_codes):
+                if used[i]:
+                    continue
+                new_code = (code << word_len) | word_code
+                new_len = length + word_len
+                bound = prefix_errors(new_code, new_len)
+                if bound > worst():
+                    continue
+
+                path.append(word)
+                dist = bound + max(0, n - new_len)
+                if dist <= worst():
+                    bisect.insort(beam, (dist, " ".join(path)))
+                    del beam[beam_size:]
+                if len(path) < self.max_len:
+                    used[i] = True
+                    visit(new_code, new_len)
+                    used[i] = False
+                path.pop()
+
+        visit(0, 0)
+        return beam
+
+    def nearest(self, bits, beam_size=10, distance="hamming", max_dist=None):
+        """Die beam_size nächstliegenden Phrasen (höchstens max_dist entfernt) als Liste von (Phrase, Distanz)."""
+        if distance != "hamming":
+            raise ValueError(f"{type(self).__name__} unterstützt nur distance='hamming', nicht {distance!r}")
+        return [(w, d) for d, w in self.search(bits, beam_size, max_dist)]
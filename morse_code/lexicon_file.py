@@ -0,0 +1,172 @@
+import mmap
+import os
+import struct
+
+from .lazy_lexicon import LazyLexicon
+from .lexicon_index import LexiconIndex, lexicon_fingerprint
+
+
+# Dateiformat (alle Zahlen little-endian, Codes big-endian wie pack_bits):
+#   Kopf:      MAGIC, Version, Anzahl Buckets, Anzahl Phrasen, Bytes pro Code, Fingerprint (32 Bytes)
+#   Buckets:   je (Bitlänge, erster Eintrag, Anzahl)
+#   Codes:     Anzahl Phrasen x Bytes pro Code (gepackte Bits)
+#   Offsets:   (Anzahl Phrasen + 1) x uint32 in den String-Block
+#   Strings:   UTF-8-Phrasen hintereinander
+MAGIC = b"MORSEIDX"
+FORMAT_VERSION = 2     # 2: Phrasen je Bucket alphabetisch sortiert (siehe LexiconIndex)
+HEADER = struct.Struct("<8sIIII32s")
+BUCKET = struct.Struct("<III")
+OFFSET = struct.Struct("<I")
+
+
+# --- Memory-mapped Sequenzen ---
+class MappedCodes:
+    """
+    Gepackte Codes eines Buckets aus der gemappten Datei. Beim ersten Zugriff (dem ersten
+    Scan dieses Buckets) einmal als Integer-Tupel dekodiert, danach wird nur noch dieses
+    gescannt. Buckets, die keine Anfrage erreicht, kosten weder Ladezeit noch Speicher.
+    """
+
+    def __init__(self, view, start, count, width):
+        self.view = view[start:start + count * width]
+        self.count = count
+        self.width = width
+        self._codes = None
+
+    def __len__(self):
+        return self.count
+
+    def codes(self):
+        if self._codes is None:
+            view, width = self.view, self.width
+            self._codes = tuple(int.from_bytes(view[pos:pos + width], "big")
+                                for pos in range(0, self.count * width, width))
+        return self._codes
+
+    def __getitem__(self, i):
+        return self.codes()[i]
+
+    def __iter__(self):
+        return iter(self.codes())
+
+
+class MappedPhrases:
+    """Phrasen eines Buckets, erst beim Zugriff aus dem String-Block dekodiert."""
+
+    def __init__(self, view, offsets_start, strings_start, first, count):
+        self.view = view
+        self.offsets_start = offsets_start + first * OFFSET.size
+        self.strings_start = strings_start
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        pos = self.offsets_start + i * OFFSET.size
+        begin, end = struct.unpack_from("<II", self.view, pos)
+        return str(self.view[self.strings_start + begin:self.strings_start + end], "utf-8")
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+
+# --- Schreiben / Laden ---
+def save_index(index, path, fingerprint=b""):
+    """Schreibt einen LexiconIndex kompakt in eine Binärdatei (atomar über eine Temp-Datei)."""
+    max_len = max(index.buckets, default=0)
+    width = max(1, (max_len + 7) // 8)
+
+    buckets, codes, offsets, strings = [], bytearray(), [0], bytearray()
+    first = 0
+    for length, (bucket_codes, phrases) in index.buckets.items():
+        buckets.append(BUCKET.pack(length, first, len(phrases)))
+        first += len(phrases)
+        for code, phrase in zip(bucket_codes, phrases):
+            codes += code.to_bytes(width, "big")
+            strings += phrase.encode("utf-8")
+            offsets.append(len(strings))
+
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(buckets), first, width,
+                            fingerprint.ljust(32, b"\0")))
+        f.write(b"".join(buckets))
+        f.write(codes)
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.write(strings)
+    os.replace(tmp_path, path)
+
+
+def load_index(path, fingerprint=None):
+    """
+    Lädt einen gespeicherten Index per mmap: nur Kopf und Bucket-Tabelle werden gelesen.
+    Die Codes eines Buckets werden beim ersten Scan dekodiert (siehe MappedCodes), die
+    Phrasen erst für die Treffer; die Datei liegt im Page-Cache und wird zwischen
+    Worker-Prozessen geteilt. Gibt None zurück, wenn der Fingerprint nicht passt oder
+    (mit fingerprint) die Datei ein älteres Format hat. ValueError bei leeren,
+    abgeschnittenen oder fremden Dateien.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < HEADER.size:
+            raise ValueError(f"{path} ist leer oder abgeschnitten")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, bucket_count, phrase_count, width, stored = HEADER.unpack_from(mm, 0)
+    if fingerprint is not None and magic == MAGIC and version != FORMAT_VERSION:
+        mm.close()
+        return None
+    if magic != MAGIC or version != FORMAT_VERSION:
+        mm.close()
+        raise ValueError(f"{path} ist keine Lexikon-Index-Datei (Version {FORMAT_VERSION})")
+    if fingerprint is not None and stored != fingerprint.ljust(32, b"\0"):
+        mm.close()
+        return None
+
+    buckets_start = HEADER.size
+    codes_start = buckets_start + bucket_count * BUCKET.size
+    offsets_start = codes_start + phrase_count * width
+    strings_start = offsets_start + (phrase_count + 1) * OFFSET.size
+    if len(mm) < strings_start or len(mm) < strings_start + OFFSET.unpack_from(mm, strings_start - OFFSET.size)[0]:
+        mm.close()
+        raise ValueError(f"{path} ist abgeschnitten")
+
+    view = memoryview(mm)
+
+    index = LexiconIndex.__new__(LexiconIndex)
+    index.buckets = {}
+    for b in range(bucket_count):
+        length, first, count = BUCKET.unpack_from(mm, buckets_start + b * BUCKET.size)
+        index.buckets[length] = (
+            MappedCodes(view, codes_start + first * width, count, width),
+            MappedPhrases(view, offsets_start, strings_start, first, count),
+        )
+    index.size = phrase_count
+    index.lanes = {}
+    index.fingerprint = stored
+    index.mmap = mm  # Referenz halten, solange der Index lebt
+    return index
+
+
+def load_or_compile(path, base_words, morse_table, max_len=4):
+    """
+    Lädt den kompilierten Index aus path; fehlt die Datei oder passt sie nicht mehr
+    zu Basiswörtern/Morse-Tabelle/max_len, wird sie einmal neu kompiliert. Leere oder
+    abgeschnittene Dateien (z.B. nach einem Absturz) werden ebenso ersetzt.
+    """
+    fingerprint = lexicon_fingerprint(base_words, morse_table, max_len)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if os.path.exists(path):
+        try:
+            index = load_index(path, fingerprint)
+        except ValueError:
+            index = None
+        if index is not None:
+            return index
+
+    save_index(LexiconIndex(LazyLexicon(base_words, morse_table, max_len), morse_table),
+               path, fingerprint)
+    return load_index(path, fingerprint)
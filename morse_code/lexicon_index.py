@@ -0,0 +1,310 @@
+import bisect
+import hashlib
+import heapq
+import itertools
+import json
+
+
+# --- Bit-Packing ---
+# 1:
+def pack_bits(bits):
+    """Packt eine Bitfolge (Liste von 0/1) in einen Integer (erstes Bit = höchstes Bit)."""
+    value = 0
+    for b in bits:
+        value = (value << 1) | b
+    return value
+
+
+# 2:
+def unpack_bits(code, length):
+    """Umkehrung von pack_bits: Integer -> Liste von 0/1 der Länge length."""
+    return [(code >> (length - 1 - i)) & 1 for i in range(length)]
+
+
+# 3:
+def hamming_packed(a, len_a, b, len_b):
+    """hamming_distance auf gepackten Bitfolgen: Fehler auf der gemeinsamen Länge + Längenstrafe."""
+    common = min(len_a, len_b)
+    return ((a >> (len_a - common)) ^ (b >> (len_b - common))).bit_count() + abs(len_a - len_b)
+
+
+# 4:
+def phrase_bits(phrase, word_bits):
+    """Setzt die Bitfolge einer Phrase aus den vorberechneten Wort-Bitfolgen zusammen."""
+    seq = []
+    for word in phrase.split(" "):
+        seq.extend(word_bits[word])
+    return seq
+
+
+# --- Fingerprint ---
+def lexicon_fingerprint(base_words, morse_table, max_len):
+    """
+    Stabiler Fingerprint (SHA-256) über Wörter bzw. Phrasen, Morse-Tabelle und weitere
+    Parameter (max_len, JSON-serialisierbar). Kennzeichnet ein Lexikon, z.B. für Index-Dateien
+    und den DecodeCache.
+    """
+    data = json.dumps([sorted(base_words),
+                       sorted((letter, list(code)) for letter, code in morse_table.items()),
+                       max_len])
+    return hashlib.sha256(data.encode("utf-8")).digest()
+
+
+# --- Edit-Distanz (Levenshtein) ---
+# 5:
+def pattern_masks(bits):
+    """Peq-Masken für Myers: Bit i von masks[c] ist gesetzt, wenn bits[i] == c."""
+    masks = [0, 0]
+    for i, b in enumerate(bits):
+        masks[b] |= 1 << i
+    return masks
+
+
+# 6:
+def edit_distance_packed(peq, m, code, length, limit=None):
+    """
+    Levenshtein-Distanz zwischen einem Muster (Peq-Masken, Länge m) und einer
+    gepackten Bitfolge (code, length), bit-parallel nach Myers/Hyyrö:
+    eine Spalte der DP-Matrix pro Bit, O(length) Integer-Operationen.
+    Mit limit wird abgebrochen, sobald die Distanz sicher > limit ist
+    (Rückgabe ist dann nur eine untere Schranke > limit).
+    """
+    if m == 0:
+        return length
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv, score = mask, 0, m
+
+    for j in range(length - 1, -1, -1):
+        eq = peq[(code >> j) & 1]
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask  # | 1: globale Distanz, erste Zeile D[0][j] = j
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+
+        # jedes der restlichen j Bits kann die Distanz höchstens um 1 senken
+        if limit is not None and score - j > limit:
+            return score - j
+    return score
+
+
+# 7:
+def edit_distance(a, b):
+    """Levenshtein-Distanz zwischen zwei Bitfolgen (Einfügen, Löschen, Ersetzen je 1)."""
+    return edit_distance_packed(pattern_masks(a), len(a), pack_bits(b), len(b))
+
+
+# --- Edit-Distanz für viele Codes gleichzeitig ---
+# 8:
+def lane_width(m, length):
+    """Spurbreite in Bits (ganze Bytes): Platz für Muster + Übertragsbit und für den Code."""
+    return 8 * ((max(m, length) + 8) // 8)
+
+
+# 9:
+def interleave(codes, width):
+    """Legt gepackte Codes nebeneinander in einen Integer, je width Bits (erster Code = oberste Spur)."""
+    size = width // 8
+    return int.from_bytes(b"".join(code.to_bytes(size, "big") for code in codes), "big")
+
+
+# 10:
+def edit_distances_lanes(peq, m, lanes, count, length, width):
+    """
+    edit_distance_packed für count Codes derselben Länge auf einmal: jeder Code liegt in einer
+    eigenen Spur von width Bits (siehe interleave), alle Spuren rechnen Myers' Bitvektoren
+    gleichzeitig in einem großen Integer. Pro Bit des Codes eine Handvoll Operationen über
+    den ganzen Bucket statt einer Python-Schleife je Phrase. Rückgabe: Liste der Distanzen.
+    """
+    if m == 0:
+        return [length] * count
+    bases = int.from_bytes((bytes(width // 8 - 1) + b"\x01") * count, "big")   # Bit 0 jeder Spur
+    fill = (1 << m) - 1
+    mask = bases * fill
+    high = bases << (m - 1)
+    eq0 = bases * peq[0]
+    diff = eq0 ^ (bases * peq[1])
+    pv, mv, score = mask, 0, bases * m
+
+    for j in range(length - 1, -1, -1):
+        eq = eq0 ^ (diff & (((lanes >> j) & bases) * fill))   # Peq je Spur nach ihrem Bit j
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq   # Übertrag bleibt im freien Bit der Spur
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        # ph und mh sind nie beide gesetzt: erst addieren, dann abziehen, keine Spur wird negativ
+        score = score + ((ph & high) >> (m - 1)) - ((mh & high) >> (m - 1))
+        ph = ((ph << 1) | bases) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+
+    size = width // 8
+    data = score.to_bytes(count * size, "big")
+    return [int.from_bytes(data[i:i + size], "big") for i in range(0, len(data), size)]
+
+
+# --- Lexikon-Index ---
+class LexiconIndex:
+    """
+    Einmal gebauter Index über alle Phrasen eines Lexikons.
+    Jede Phrase wird genau einmal in Morse-Bits umgewandelt, als Integer gepackt
+    und zusammen mit ihrer Länge nach Bitlänge gruppiert abgelegt:
+        buckets = {Bitlänge: (gepackte Bits, Phrasen)}
+    Innerhalb eines Buckets sind die Phrasen alphabetisch sortiert; die Scorer liefern
+    Positionen, und Phrasen werden erst für die Kandidaten eines Beams gelesen.
+    Ein Decode ist danach nur noch ein Scan über Integer (XOR + bit_count),
+    ohne erneutes Kodieren der Phrasen.
+    fingerprint: über Phrasen und Morse-Tabelle (bei geladenen Dateien der gespeicherte).
+    """
+
+    def __init__(self, lexicon, morse_table):
+        # Wörter nur einmal kodieren, Phrasen daraus zusammensetzen
+        word_bits = {}
+        for phrase in lexicon:
+            for word in phrase.split(" "):
+                if word not in word_bits:
+                    word_bits[word] = [b for ch in word if ch in morse_table
+                                       for b in morse_table[ch]]
+
+        buckets = {}
+        for phrase in lexicon:
+            bits = phrase_bits(phrase, word_bits)
+            codes, phrases = buckets.setdefault(len(bits), ([], []))
+            codes.append(pack_bits(bits))
+            phrases.append(phrase)
+
+        self.buckets = {}
+        for length, (codes, phrases) in sorted(buckets.items()):
+            entries = sorted(zip(phrases, codes))
+            self.buckets[length] = (tuple(code for _, code in entries), tuple(phrase for phrase, _ in entries))
+        self.size = sum(len(phrases) for _, phrases in self.buckets.values())
+        self.lanes = {}
+        self.fingerprint = lexicon_fingerprint(self, morse_table, None)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for _, phrases in self.buckets.values():
+            yield from phrases
+
+    def bucket_distances(self, bits, length):
+        """
+        Liefert (Distanz, Position im Bucket) für alle Phrasen einer Bitlänge.
+        Gleiche Semantik wie hamming_distance: Vergleich auf der gemeinsamen
+        Länge + Strafe abs(len(a) - len(b)).
+        """
+        codes = self.buckets[length][0]
+        n = len(bits)
+        common = min(n, length)
+        q = pack_bits(bits) >> (n - common)
+        shift = length - common
+        penalty = abs(n - length)
+        for pos, code in enumerate(codes):
+            yield ((q ^ (code >> shift)).bit_count() + penalty, pos)
+
+    def bucket_lanes(self, length, width):
+        """
+        Bucket nach Anzahl Einsen sortiert, für edit_distances_lanes vorbereitet (einmal pro
+        Bitlänge und Spurbreite): (Positionen, Einsen je Code aufsteigend, verschränkte Codes).
+        """
+        key = (length, width)
+        if key not in self.lanes:
+            codes = self.buckets[length][0]
+            order = sorted(range(len(codes)), key=lambda i: codes[i].bit_count())
+            ones = [codes[i].bit_count() for i in order]
+            self.lanes[key] = (order, ones, interleave([codes[i] for i in order], width))
+        return self.lanes[key]
+
+    def bucket_edit_distances(self, bits, length, limit=None):
+        """
+        Liefert (Levenshtein-Distanz, Position im Bucket) für die Phrasen einer Bitlänge; mit limit
+        nur die, deren Distanz <= limit sein kann.
+        Ein eingefügtes oder verlorenes Bit (z.B. durch den Debouncer) kostet 1
+        statt aller folgenden Positionen.
+        """
+        n = len(bits)
+        width = lane_width(n, length)
+        order, ones_sorted, lanes = self.bucket_lanes(length, width)
+
+        lo, hi = 0, len(order)
+        if limit is not None:
+            # jede Operation ändert die Anzahl Einsen und Nullen um höchstens 1:
+            # Einsen im Code innerhalb von ones +- limit und length - n + ones +- limit
+            ones = sum(bits)
+            shift = length - n
+            lo = bisect.bisect_left(ones_sorted, max(ones, ones + shift) - limit)
+            hi = bisect.bisect_right(ones_sorted, min(ones, ones + shift) + limit)
+            if lo >= hi:
+                return
+            lanes = (lanes >> ((len(order) - hi) * width)) & ((1 << ((hi - lo) * width)) - 1)
+
+        dists = edit_distances_lanes(pattern_masks(bits), n, lanes, hi - lo, length, width)
+        for pos, dist in zip(order[lo:hi], dists):
+            yield (dist, pos)
+
+    def distances(self, bits, distance="hamming"):
+        """Liefert (Distanz, Phrase) für jede Phrase im Index."""
+        scorer = self.scorer(distance)
+        for length, (_, phrases) in self.buckets.items():
+            for dist, pos in scorer(bits, length):
+                yield dist, phrases[pos]
+
+    def scorer(self, distance):
+        """Bucket-Scorer für den Distanz-Modus 'hamming' oder 'levenshtein'."""
+        if distance == "hamming":
+            return lambda bits, length, limit=None: self.bucket_distances(bits, length)
+        if distance == "levenshtein":
+            return self.bucket_edit_distances
+        raise ValueError(f"Unbekannter Distanz-Modus: {distance!r}")
+
+    def buckets_by_bound(self, n):
+        """
+        Bitlängen der Buckets, sortiert nach ihrer unteren Schranke abs(n - Länge).
+        Die Längenstrafe allein ist schon eine untere Schranke für jede Distanz im Bucket.
+        """
+        return sorted(self.buckets, key=lambda length: (abs(n - length), length))
+
+    def search(self, bits, beam_size=10, max_dist=None, distance="hamming"):
+        """
+        Beam-Suche mit Früh-Abbruch über die Längen-Buckets.
+        Besucht die Buckets nach steigender unterer Schranke und bricht ab, sobald
+        die Schranke schlechter ist als der schlechteste Eintrag im vollen Beam
+        (bzw. als max_dist). Ergebnis identisch zu einem vollständigen Scan:
+        Liste von (Distanz, Phrase), sortiert nach (Distanz, Phrase).
+        distance: 'hamming' oder 'levenshtein' (abs(n - L) ist für beide eine untere Schranke)
+        Pro Bucket werden nur die besten beam_size Positionen zu Phrasen aufgelöst; da die
+        Phrasen im Bucket sortiert sind, entspricht (Distanz, Position) dort (Distanz, Phrase).
+        """
+        scorer = self.scorer(distance)
+        beam = []
+        for length in self.buckets_by_bound(len(bits)):
+            bound = abs(len(bits) - length)
+            if max_dist is not None and bound > max_dist:
+                break
+            if len(beam) == beam_size and bound > beam[-1][0]:
+                break  # kein Eintrag dieses oder späterer Buckets kann den Beam noch verbessern
+
+            limit = max_dist
+            if len(beam) == beam_size and (limit is None or beam[-1][0] < limit):
+                limit = beam[-1][0]
+            candidates = scorer(bits, length, limit)
+            if max_dist is not None:
+                candidates = (c for c in candidates if c[0] <= max_dist)
+            phrases = self.buckets[length][1]
+            best = [(dist, phrases[pos]) for dist, pos in heapq.nsmallest(beam_size, candidates)]
+            beam = heapq.nsmallest(beam_size, itertools.chain(beam, best))
+        return beam
+
+    def nearest(self, bits, beam_size=10, distance="hamming", max_dist=None):
+        """Die beam_size nächstliegenden Phrasen (höchstens max_dist entfernt) als Liste von (Phrase, Distanz)."""
+        return [(w, d) for d, w in self.search(bits, beam_size, max_dist, distance)]
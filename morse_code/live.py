@@ -0,0 +1,133 @@
+import threading
+import time
+
+from .capture import classify_frame, create_hands, open_source
+from .decode_cache import DecodeCache
+from .decoder import LEXICON_PATH, decode_with_lexicon_or_estimate, default_lexicon_index
+from .morse import MORSE_TABLE
+from .pipeline import _Failure
+from .profiling import PROFILER
+from .state_estimation import GAP_TOLERANCE_SECONDS, STABLE_MIN_SECONDS, TimedDebouncer
+
+
+# --- Kamera lesen ---
+class LatestFrameReader:
+    """
+    Liest eine Live-Quelle in einem eigenen Thread und hält nur den neuesten Frame.
+    Ist die Verarbeitung langsamer als die Kamera, werden ältere Frames verworfen
+    (statt einen wachsenden Rückstau aufzubauen); dropped zählt diese Frames.
+    Eine Ausnahme im Lese-Thread wird wie in pipeline weitergereicht und in read() ausgelöst.
+    """
+
+    def __init__(self, cap):
+        self.cap = cap
+        self.frame = None
+        self.timestamp = None     # time.perf_counter() beim Einlesen
+        self.dropped = 0
+        self.finished = False
+        self.failure = None
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            while not self.finished:
+                success, frame = self.cap.read()
+                now = time.perf_counter()
+                with self._cond:
+                    if not success:
+                        self.finished = True
+                    else:
+                        if self.frame is not None:
+                            self.dropped += 1   # vorheriger Frame wurde nie abgeholt
+                        self.frame, self.timestamp = frame, now
+                    self._cond.notify()
+        except BaseException as exc:
+            with self._cond:
+                self.failure = _Failure(exc)
+                self.finished = True
+                self._cond.notify()
+
+    def read(self):
+        """Wartet auf den nächsten neuen Frame; (None, None), wenn die Quelle zu Ende ist."""
+        with self._cond:
+            while self.frame is None and not self.finished:
+                self._cond.wait()
+            if self.frame is None and self.failure is not None:
+                raise self.failure.exc
+            frame, timestamp = self.frame, self.timestamp
+            self.frame = None
+            return frame, timestamp
+
+    def stop(self):
+        """Lese-Thread beenden und auf ihn warten; danach darf cap freigegeben werden."""
+        self.finished = True
+        self._thread.join()   # ohne Timeout: ein laufendes cap.read muss fertig sein
+
+
+def live_frame_states(source, **settings):
+    """Generator über (Zustand, Zeitstempel) einer Kamera/eines Streams, in Echtzeit."""
+    cap = open_source(source)
+    hands = create_hands(**settings)
+    reader = LatestFrameReader(cap)
+    try:
+        while True:
+            frame, timestamp = reader.read()
+            if frame is None:
+                break
+            yield classify_frame(frame, hands), timestamp
+    finally:
+        reader.stop()
+        cap.release()
+        hands.close()
+        print(f"Verworfene Frames: {reader.dropped}")
+
+
+# --- Live-Dekodierung ---
+def run_live(source, max_hamming=2, distance="hamming", lexicon_path=LEXICON_PATH,
+             stable_min_seconds=STABLE_MIN_SECONDS, gap_tolerance_seconds=GAP_TOLERANCE_SECONDS):
+    """
+    Liest eine Kamera bzw. einen Stream und gibt jedes Bit sofort aus, sobald es bestätigt ist.
+    Eine Handpause länger als gap_tolerance_seconds beendet ein Wort; es wird dann dekodiert.
+    Die Schwellen gelten in Sekunden, verworfene Frames verfälschen die Haltedauer also nicht.
+    Latenz: Zeit vom Einlesen des bestätigenden Frames bis zur Ausgabe (Verarbeitung)
+    und vom Beginn der Geste bis zur Ausgabe (inkl. Haltedauer). Die Geste beginnt mit dem
+    ersten Frame, ab dem der Debouncer den Zustand des Bits verfolgt (auch wenn er Zähler
+    aus einer vorigen Handpause übernimmt).
+    """
+    lexicon = default_lexicon_index(lexicon_path)   # vorher laden, nicht beim ersten Wort
+    decode = DecodeCache(decode_with_lexicon_or_estimate)   # wiederholte Wörter nicht neu suchen
+    debouncer = TimedDebouncer(stable_min_seconds, gap_tolerance_seconds)
+    push = PROFILER.wrap("debounce", debouncer.push)
+    bits = []
+    words = []
+    gesture_start = None
+
+    def finish_word():
+        text = decode(bits, MORSE_TABLE, lexicon, max_hamming=max_hamming, distance=distance)
+        print(f"Wort: '{text}'  Bits: {bits}")
+        words.append(text)
+        bits.clear()
+
+    print(f"Live: {source} (Strg+C zum Beenden)\n")
+    try:
+        for state, timestamp in live_frame_states(source):
+            previous = debouncer.current_state
+            bit = push(state, timestamp)
+            if debouncer.current_state not in (None, -1) and (debouncer.started or debouncer.current_state != previous):
+                gesture_start = timestamp   # Zustand des nächsten Bits beginnt
+
+            if bit is not None:
+                now = time.perf_counter()
+                bits.append(bit)
+                print(f"Bit: {bit}  Latenz: {(now - timestamp) * 1000:.0f} ms "
+                      f"(seit Gestenbeginn {(now - gesture_start) * 1000:.0f} ms)")
+            elif debouncer.idle and bits:
+                finish_word()
+    except KeyboardInterrupt:
+        pass
+
+    if bits:
+        finish_word()
+    return " ".join(word for word in words if word)
@@ -0,0 +1,60 @@
+import itertools
+
+
+# --- Morse-Tabelle ---
+MORSE_TABLE_STR = {
+    "A": "01",     "B": "1000",  "C": "1010", "D": "100",  "E": "0",
+    "F": "0010",   "G": "110",   "H": "0000", "I": "00",   "J": "0111",
+    "K": "101",    "L": "0100",  "M": "11",   "N": "10",   "O": "111",
+    "P": "0110",   "Q": "1101",  "R": "010",  "S": "000",  "T": "1",
+    "U": "001",    "V": "0001",  "W": "011",  "X": "1001", "Y": "1011",
+    "Z": "1100",   " ": ""
+}
+
+# Umwandlung: String -> Liste von ints
+MORSE_TABLE = {letter: [int(ch) for ch in code]
+               for letter, code in MORSE_TABLE_STR.items()}
+
+# --- Wörter ---
+BASE_WORDS = {"HALLO", "HELLO", "WELT", "TEST", "HILFE", "MORSE", "CODE",
+              "ICH", "MEIN", "NAME", "IST", "BRAUCHE", "ARSHIA", "ELHAM",
+              "LOVE", "MOVE", "HELP", "SADRA", "KASRA"}
+
+
+# --- Hilfsfunktionen ---
+# 1:
+def hamming_distance(a, b):
+    """Berechnet Hamming-Distanz zwischen zwei Bitfolgen."""
+    if len(a) != len(b):
+        # wenn unterschiedlich lang: Strafe
+        min_len = min(len(a), len(b))
+        dist = sum(x != y for x, y in zip(a[:min_len], b[:min_len]))
+        dist += abs(len(a) - len(b))
+        return dist
+    return sum(x != y for x, y in zip(a, b))
+
+# 2:
+def bits_for_word(word, morse_table):
+    """Wandle ein Wort oder Phrase in eine Bitfolge um."""
+    seq = []
+    for ch in word.replace(" ", ""):   # Leerzeichen ignorieren
+        if ch in morse_table:
+            seq.extend(morse_table[ch])
+    return seq
+
+
+# 3: Dynamischer Lexikon-Kombinator
+def expand_lexicon(base_words, morse_table, max_len=4):
+    """
+    Erzeugt neue Phrasen (z.B. 'MEIN NAME IST ARSHIA') automatisch.
+    max_len = maximale Anzahl Wörter pro Phrase
+    """
+    lexicon = set(base_words)
+
+    # Alle möglichen Kombinationen bis max_len
+    for l in range(2, max_len + 1):
+        for combo in itertools.permutations(base_words, l):
+            phrase = " ".join(combo)
+            lexicon.add(phrase)
+
+    return lexicon
@@ -0,0 +1,215 @@
+import os
+
+import cv2
+
+from .capture import create_hands, frame_time, is_hand_open, open_source, open_video, read_frames
+from .decode_cache import DecodeCache
+from .decoder import LEXICON_PATH, decode_with_lexicon_or_estimate, default_lexicon_index
+from .live import LatestFrameReader
+from .morse import MORSE_TABLE
+from .profiling import stage
+from .state_estimation import GAP_TOLERANCE_SECONDS, STABLE_MIN_SECONDS, TimedDebouncer
+
+
+MAX_HANDS = 2          # Standard für max_num_hands im Mehrpersonen-Modus
+MATCH_DISTANCE = 0.2   # größter Sprung des Handmittelpunkts zwischen zwei Frames (in Bildbreite/-höhe)
+TRACK_TIMEOUT = 5.0    # Sekunden ohne Hand, bis eine Identität aufgegeben wird
+
+
+# --- Hilfsfunktionen ---
+def hand_center(hand_landmarks):
+    """Mittelpunkt aller Landmarken einer Hand (normierte Bildkoordinaten)."""
+    landmarks = hand_landmarks.landmark
+    return (sum(lm.x for lm in landmarks) / len(landmarks),
+            sum(lm.y for lm in landmarks) / len(landmarks))
+
+
+def frame_hands(frame, hands):
+    """Ein BGR-Frame -> Landmarken aller erkannten Hände (eine MediaPipe-Auswertung für alle)."""
+    with stage("color_convert"):
+        image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    with stage("hands_process"):
+        results = hands.process(image)
+    return results.multi_hand_landmarks or []
+
+
+def source_frames(source):
+    """
+    (Frame, Zeitstempel in s) aus einer Video-Datei (Zeit laut Container) oder live aus
+    Kamera/Stream (Einlesezeit, ältere Frames werden wie bei live verworfen).
+    """
+    if isinstance(source, str) and os.path.isfile(source):
+        cap = open_video(source)
+        try:
+            for frame in read_frames(cap):
+                yield frame, frame_time(cap)
+        finally:
+            cap.release()
+        return
+
+    cap = open_source(source)
+    reader = LatestFrameReader(cap)
+    try:
+        while True:
+            frame, timestamp = reader.read()
+            if frame is None:
+                break
+            yield frame, timestamp
+    finally:
+        reader.stop()
+        cap.release()
+
+
+# --- Identitäten ---
+class Signaller:
+    """Ein Signalgeber (eine Hand) mit eigener Entprellung und eigenen Bits/Wörtern."""
+
+    def __init__(self, ident, center, timestamp, stable_min_seconds=STABLE_MIN_SECONDS,
+                 gap_tolerance_seconds=GAP_TOLERANCE_SECONDS):
+        self.ident = ident
+        self.center = center
+        self.last_seen = timestamp
+        self.debouncer = TimedDebouncer(stable_min_seconds, gap_tolerance_seconds)
+        self.bits = []
+        self.words = []
+
+
+class HandTracker:
+    """
+    Ordnet die Hände eines Frames den Signalgebern des vorigen Frames zu: das jeweils
+    nächstgelegene Paar (Handmittelpunkt zu letzter Position) zuerst, höchstens
+    max_distance entfernt. Übrige Hände bekommen eine neue Identität; wer länger als
+    timeout Sekunden nicht zu sehen war, wird aufgegeben.
+    """
+
+    def __init__(self, max_distance=MATCH_DISTANCE, timeout=TRACK_TIMEOUT, **debounce_settings):
+        self.max_distance = max_distance
+        self.timeout = timeout
+        self.debounce_settings = debounce_settings
+        self.signallers = {}    # Identität -> Signaller
+        self.next_ident = 1
+
+    def assign(self, centers, timestamp):
+        """Liste der Signalgeber, passend zur Reihenfolge von centers."""
+        pairs = sorted((_distance(center, signaller.center), i, ident)
+                       for i, center in enumerate(centers)
+                       for ident, signaller in self.signallers.items())
+        assigned = [None] * len(centers)
+        taken = set()
+        for dist, i, ident in pairs:
+            if dist > self.max_distance:
+                break
+            if assigned[i] is None and ident not in taken:
+                assigned[i] = self.signallers[ident]
+                taken.add(ident)
+
+        for i, center in enumerate(centers):
+            if assigned[i] is None:
+                assigned[i] = Signaller(self.next_ident, center, timestamp, **self.debounce_settings)
+                self.signallers[self.next_ident] = assigned[i]
+                self.next_ident += 1
+            assigned[i].center = center
+            assigned[i].last_seen = timestamp
+        return assigned
+
+    def expire(self, timestamp):
+        """Entfernt Signalgeber, die länger als timeout nicht zu sehen waren, und gibt sie zurück."""
+        expired = [s for s in self.signallers.values() if timestamp - s.last_seen > self.timeout]
+        for signaller in expired:
+            del self.signallers[signaller.ident]
+        return expired
+
+
+def _distance(a, b):
+    return ((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2) ** 0.5
+
+
+# --- Dekodierung ---
+class MultiSignallerDecoder:
+    """
+    Dekodiert mehrere Signalgeber in einem Stream: pro Frame eine gemeinsame
+    MediaPipe-Auswertung, danach pro Hand nur is_hand_open und die eigene Entprellung.
+    push liefert Ereignisse (Identität, "bit" | "word", Wert); ein Wort endet wie bei
+    live mit einer Handpause länger als gap_tolerance_seconds.
+    """
+
+    def __init__(self, lexicon, max_hamming=2, distance="hamming", stable_min_seconds=STABLE_MIN_SECONDS,
+                 gap_tolerance_seconds=GAP_TOLERANCE_SECONDS, max_distance=MATCH_DISTANCE, timeout=TRACK_TIMEOUT):
+        self.lexicon = lexicon
+        self.decode = DecodeCache(decode_with_lexicon_or_estimate)   # gemeinsam für alle Signalgeber
+        self.max_hamming = max_hamming
+        self.distance = distance
+        self.tracker = HandTracker(max_distance, timeout, stable_min_seconds=stable_min_seconds,
+                                   gap_tolerance_seconds=gap_tolerance_seconds)
+
+    def push(self, hands_landmarks, timestamp):
+        """Alle Hände eines Frames verarbeiten; gibt die neuen Ereignisse zurück."""
+        events = []
+        signallers = self.tracker.assign([hand_center(hand) for hand in hands_landmarks], timestamp)
+        seen = set()
+        for signaller, hand_landmarks in zip(signallers, hands_landmarks):
+            with stage("is_hand_open"):
+                state = 1 if is_hand_open(hand_landmarks) else 0
+            self._push(signaller, state, timestamp, events)
+            seen.add(signaller.ident)
+
+        # Nicht sichtbare Signalgeber: Lücke, damit ihre Entprellung die Zeit mitbekommt
+        for signaller in list(self.tracker.signallers.values()):
+            if signaller.ident not in seen:
+                self._push(signaller, -1, timestamp, events)
+
+        for signaller in self.tracker.expire(timestamp):
+            if signaller.bits:
+                events.append(self._finish_word(signaller))
+        return events
+
+    def flush(self):
+        """Ende des Streams: angefangene Wörter aller Signalgeber dekodieren."""
+        return [self._finish_word(s) for s in self.tracker.signallers.values() if s.bits]
+
+    def _push(self, signaller, state, timestamp, events):
+        bit = signaller.debouncer.push(state, timestamp)
+        if bit is not None:
+            signaller.bits.append(bit)
+            events.append((signaller.ident, "bit", bit))
+        elif signaller.debouncer.idle and signaller.bits:
+            events.append(self._finish_word(signaller))
+
+    def _finish_word(self, signaller):
+        text = self.decode(signaller.bits, MORSE_TABLE, self.lexicon,
+                           max_hamming=self.max_hamming, distance=self.distance)
+        signaller.words.append(text)
+        signaller.bits = []
+        return signaller.ident, "word", text
+
+
+def run_multi(source, num_hands=MAX_HANDS, max_hamming=2, distance="hamming", lexicon_path=LEXICON_PATH,
+              stable_min_seconds=STABLE_MIN_SECONDS, gap_tolerance_seconds=GAP_TOLERANCE_SECONDS):
+    """
+    Video-Datei, Kamera oder Stream mit bis zu num_hands Signalgebern dekodieren.
+    Gibt Bits und Wörter mit der Identität des Signalgebers aus, z.B. "[Hand 2] Wort: 'HELLO'".
+    """
+    lexicon = default_lexicon_index(lexicon_path)
+    decoder = MultiSignallerDecoder(lexicon, max_hamming, distance, stable_min_seconds, gap_tolerance_seconds)
+    hands = create_hands(max_num_hands=num_hands)
+    messages = {}
+
+    def report(events):
+        for ident, kind, value in events:
+            if kind == "bit":
+                print(f"[Hand {ident}] Bit: {value}")
+            else:
+                print(f"[Hand {ident}] Wort: '{value}'")
+                messages.setdefault(ident, []).append(value)
+
+    print(f"Mehrere Signalgeber: {source}, bis zu {num_hands} Hände (Strg+C zum Beenden)\n")
+    try:
+        for frame, timestamp in source_frames(source):
+            report(decoder.push(frame_hands(frame, hands), timestamp))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        hands.close()
+
+    report(decoder.flush())
+    return {ident: " ".join(word for word in words if word) for ident, words in messages.items()}
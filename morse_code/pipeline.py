@@ -0,0 +1,121 @@
+import queue
+import threading
+from collections import deque
+
+from .state_estimation import GAP_TOLERANCE, STABLE_MIN_FRAMES, stream_bits
+
+
+QUEUE_SIZE = 8     # Frames pro Warteschlange; begrenzt Speicher und sorgt für Rückstau
+
+
+_END = object()    # Markierung: Stufe ist fertig
+
+
+class _Failure:
+    """Ausnahme einer Stufe, wird an den Verbraucher weitergereicht."""
+
+    def __init__(self, exc):
+        self.exc = exc
+
+
+# --- Hilfsfunktionen ---
+def _put(out, item, stop):
+    """Blockiert, solange die Warteschlange voll ist (Rückstau), außer die Pipeline wird beendet."""
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _drain(source, stop):
+    """Elemente aus einer Warteschlange in Reihenfolge liefern, bis _END kommt."""
+    while not stop.is_set():
+        try:
+            item = source.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if item is _END:
+            return
+        if isinstance(item, _Failure):
+            raise item.exc
+        yield item
+
+
+def _worker(stage, items, out, stop):
+    try:
+        for item in stage(items):
+            if not _put(out, item, stop):
+                return
+    except BaseException as exc:
+        _put(out, _Failure(exc), stop)
+        return
+    _put(out, _END, stop)
+
+
+# --- Pipeline ---
+def pipeline(source, *stages, queue_size=QUEUE_SIZE):
+    """
+    Führt source und jede Stufe in einem eigenen Thread aus, verbunden durch begrenzte
+    Warteschlangen. Eine Stufe ist eine Funktion Iterable -> Iterable (z.B. ein Generator).
+    Jede Stufe läuft in genau einem Thread, daher bleibt die Reihenfolge erhalten.
+    Liefert die Ausgabe der letzten Stufe; Fehler einer Stufe werden hier ausgelöst.
+    """
+    stop = threading.Event()
+    threads = []
+    upstream = source
+    for stage in (iter,) + stages:
+        out = queue.Queue(maxsize=queue_size)
+        thread = threading.Thread(target=_worker, args=(stage, upstream, out, stop), daemon=True)
+        thread.start()
+        threads.append(thread)
+        upstream = _drain(out, stop)
+
+    try:
+        yield from upstream
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def threaded_video_bits(video_path, stable_min_frames=STABLE_MIN_FRAMES, gap_tolerance=GAP_TOLERANCE,
+                        queue_size=QUEUE_SIZE, step=1, roi=False, bits_stage=None, timed=False, **settings):
+    """
+    Wie stream_bits(stream_frame_states(video_path)), aber parallel:
+    1: Lese-Thread (cap.read),
+    2: Inferenz (cvtColor + hands.process + is_hand_open),
+    3: Entprellung.
+    Die Bitfolge ist identisch zur sequentiellen Version.
+    bits_stage: eigene Entprellung (Iterable -> Bits), z.B. stream_bits_timed mit timed=True.
+    """
+    from .capture import (RoiHands, adaptive_states, classify_frame, create_hands, open_video, read_frames,
+                          with_timestamps)
+
+    cap = open_video(video_path)
+    hands = create_hands(**settings)
+    if roi:
+        hands = RoiHands(hands)
+    timestamps = deque() if timed else None
+
+    def infer(frames):
+        if step > 1:
+            yield from adaptive_states(frames, hands, step, min_run=stable_min_frames)
+            return
+        for frame in frames:
+            yield classify_frame(frame, hands)
+
+    def debounce_stage(states):
+        if timed:
+            states = with_timestamps(states, timestamps)
+        if bits_stage is not None:
+            return bits_stage(states)
+        return stream_bits(states, stable_min_frames, gap_tolerance)
+
+    try:
+        yield from pipeline(read_frames(cap, timestamps), infer, debounce_stage, queue_size=queue_size)
+    finally:
+        cap.release()
+        hands.close()
@@ -0,0 +1,169 @@
+import json
+import random
+import time
+from array import array
+
+
+MAX_SAMPLES = 10000    # gehaltene Messwerte pro Schritt; Anzahl und Summe zählen trotzdem alle
+
+
+# --- Hilfsfunktionen ---
+def percentile(sorted_values, q):
+    """Nächster-Rang-Perzentil (q in 0..100) einer sortierten Liste."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(-(-q * len(sorted_values) // 100)) - 1, 0)   # ceil(q/100 * n) - 1
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+# --- Profiler ---
+class Profiler:
+    """
+    Sammelt Laufzeiten pro Schritt (Video lesen, Farbkonvertierung, hands.process,
+    is_hand_open, Entprellung, Lexikon-Suche) in Sekunden, als kompaktes array.
+    Pro Schritt werden höchstens max_samples Werte gehalten (Reservoir-Stichprobe, jeder
+    Messwert mit gleicher Wahrscheinlichkeit), damit lange live-Sitzungen nicht wachsen;
+    count und total bleiben exakt, die Perzentile kommen aus der Stichprobe.
+    Standardmäßig aus: stage() liefert dann nur einen leeren Kontext, wrap() die
+    unveränderte Funktion.
+    """
+
+    def __init__(self, max_samples=MAX_SAMPLES):
+        self.enabled = False
+        self.max_samples = max_samples
+        self.reset()
+
+    def reset(self):
+        self.samples = {}
+        self.counts = {}
+        self.totals = {}
+
+    def record(self, name, seconds):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = array("d")
+            self.counts[name] = 0
+            self.totals[name] = 0.0
+        count = self.counts[name] = self.counts[name] + 1
+        self.totals[name] += seconds
+        if len(samples) < self.max_samples:
+            samples.append(seconds)
+        else:
+            slot = random.randrange(count)
+            if slot < self.max_samples:
+                samples[slot] = seconds
+
+    def take(self):
+        """Messwerte abgeben und zurücksetzen, z.B. in einem Worker-Prozess: {Schritt: (count, total, array)}."""
+        data = {name: (self.counts[name], self.totals[name], self.samples[name]) for name in self.samples}
+        self.reset()
+        return data
+
+    def merge(self, data):
+        """Messwerte aus take() (z.B. eines anderen Prozesses) übernehmen."""
+        for name, (count, total, values) in data.items():
+            samples = self.samples.setdefault(name, array("d"))
+            self.counts[name] = self.counts.get(name, 0) + count
+            self.totals[name] = self.totals.get(name, 0.0) + total
+            samples.extend(values)
+            if len(samples) > self.max_samples:
+                self.samples[name] = array("d", random.sample(samples, self.max_samples))
+
+    def stage(self, name):
+        """with profiler.stage("name"): ... misst den Block (nur wenn eingeschaltet)."""
+        return _Stage(self, name) if self.enabled else _NULL_STAGE
+
+    def wrap(self, name, func):
+        """func mit Zeitmessung umhüllen; für enge Schleifen einmalig statt pro Aufruf prüfen."""
+        if not self.enabled:
+            return func
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+        return timed
+
+    def summary(self):
+        """{Schritt: {count, total, mean, p50, p95, p99}} in Sekunden."""
+        result = {}
+        for name, samples in self.samples.items():
+            values = sorted(samples)
+            count, total = self.counts[name], self.totals[name]
+            result[name] = {
+                "count": count,
+                "total": total,
+                "mean": total / count,
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "p99": percentile(values, 99),
+            }
+        return result
+
+    def to_json(self):
+        return json.dumps(self.summary(), indent=2)
+
+    def to_prometheus(self, metric="morse_code_stage_seconds"):
+        """Prometheus-Textformat (Summary mit Quantilen, _sum und _count pro Schritt)."""
+        lines = [f"# HELP {metric} Laufzeit pro Verarbeitungsschritt in Sekunden.",
+                 f"# TYPE {metric} summary"]
+        for name, stats in self.summary().items():
+            for q in ("p50", "p95", "p99"):
+                quantile = int(q[1:]) / 100
+                lines.append(f'{metric}{{stage="{name}",quantile="{quantile}"}} {stats[q]:.9f}')
+            lines.append(f'{metric}_sum{{stage="{name}"}} {stats["total"]:.9f}')
+            lines.append(f'{metric}_count{{stage="{name}"}} {stats["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, fmt="json"):
+        """fmt: 'json' oder 'prometheus'."""
+        if fmt == "json":
+            return self.to_json()
+        if fmt == "prometheus":
+            return self.to_prometheus()
+        raise ValueError(f"Unbekanntes Format: {fmt}")
+
+
+PROFILER = Profiler()    # prozessweiter Profiler, per enable() bzw. --profile eingeschaltet
+
+
+def enable():
+    PROFILER.enabled = True
+
+
+def disable():
+    PROFILER.enabled = False
+
+
+def stage(name):
+    """Kurzform für PROFILER.stage(name)."""
+    return PROFILER.stage(name)
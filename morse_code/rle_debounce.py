@@ -0,0 +1,173 @@
+import numpy as np
+
+from .state_estimation import GAP_TOLERANCE, STABLE_MIN_FRAMES
+
+
+_NONE = -2     # kein Zustand (current_state is None)
+_PAD = 9       # Auffüllwert für Streams mit weniger Läufen
+
+
+# --- Hilfsfunktionen ---
+# 1:
+def run_lengths(frames):
+    """Lauflängenkodierung: [1, 1, 0, -1, -1] -> (Werte [1, 0, -1], Längen [2, 1, 2])."""
+    frames = np.asarray(frames, dtype=np.int8)
+    if frames.size == 0:
+        return np.zeros(0, dtype=np.int8), np.zeros(0, dtype=np.int64)
+    starts = np.flatnonzero(np.concatenate(([True], frames[1:] != frames[:-1])))
+    lengths = np.diff(np.append(starts, frames.size))
+    return frames[starts], lengths
+
+
+# 2:
+def batch_run_lengths(streams):
+    """
+    Lauflängen vieler Streams in einem Durchlauf, als aufgefüllte (Streams x Läufe)-Matrizen.
+    Leere Einträge: Wert _PAD, Länge 0.
+    """
+    sizes = np.array([len(s) for s in streams], dtype=np.int64)
+    if sizes.sum() == 0:
+        return np.full((len(streams), 0), _PAD, dtype=np.int8), np.zeros((len(streams), 0), dtype=np.int64)
+
+    frames = np.concatenate([np.asarray(s, dtype=np.int8) for s in streams])
+    stream_ids = np.repeat(np.arange(len(streams)), sizes)
+
+    # Neuer Lauf bei Wertwechsel oder Stream-Grenze
+    new_run = np.ones(frames.size, dtype=bool)
+    new_run[1:] = (frames[1:] != frames[:-1]) | (stream_ids[1:] != stream_ids[:-1])
+    starts = np.flatnonzero(new_run)
+    lengths = np.diff(np.append(starts, frames.size))
+    run_stream = stream_ids[starts]
+
+    # Laufnummer innerhalb des eigenen Streams
+    first_run = np.searchsorted(run_stream, np.arange(len(streams)))
+    run_index = np.arange(starts.size) - first_run[run_stream]
+
+    width = int(run_index.max()) + 1
+    values = np.full((len(streams), width), _PAD, dtype=np.int8)
+    run_lens = np.zeros((len(streams), width), dtype=np.int64)
+    values[run_stream, run_index] = frames[starts]
+    run_lens[run_stream, run_index] = lengths
+    return values, run_lens
+
+
+# --- Entprellung auf Läufen ---
+def debounce_runs(values, lengths, stable_min_frames=STABLE_MIN_FRAMES, gap_tolerance=GAP_TOLERANCE):
+    """
+    Entprellung eines Streams auf Läufen statt Frames, Bit für Bit wie debounce().
+    Ein Lauf aus L gleichen Frames wird in einem Schritt verarbeitet:
+    1: kein Zustand: Zustand = Wert, Zähler = L
+    2: gleicher Wert: Zähler += L
+    3: -1 (Lücke): überschreitet die Lücke gap_tolerance, endet der Zustand; die restlichen
+       Frames des Laufs beginnen einen neuen Zustand -1
+    4: anderer Wert: stabiler Zustand -> Bit, Zähler = L; sonst zählt der Zähler weiter (L - 1,
+       der erste Frame des Wechsels zählt im Original nicht mit)
+    """
+    bits = []
+    state, count, gap = None, 0, 0
+    for value, length in zip(values.tolist(), lengths.tolist()):
+        if state is None:
+            state, count, gap = value, length, 0
+        elif value == state:
+            count += length
+            gap = 0
+        elif value == -1:
+            needed = gap_tolerance - gap + 1   # Frames bis zum Überschreiten
+            if length >= needed:
+                if count >= stable_min_frames and state != -1:
+                    bits.append(state)
+                rest = length - needed
+                state, count, gap = (-1, rest, 0) if rest else (None, 0, 0)
+            else:
+                gap += length
+        else:
+            if count >= stable_min_frames and state != -1:
+                bits.append(state)
+                count, gap = length, 0
+            else:
+                count += length - 1
+                if length > 1:
+                    gap = 0
+            state = value
+
+    if count >= stable_min_frames and state != -1:
+        bits.append(state)
+    return bits
+
+
+def debounce_rle(frames, stable_min_frames=STABLE_MIN_FRAMES, gap_tolerance=GAP_TOLERANCE):
+    """Wie debounce(frames), aber über NumPy-Lauflängen (für lange, gespeicherte Zustandsfolgen)."""
+    values, lengths = run_lengths(frames)
+    return debounce_runs(values, lengths, stable_min_frames, gap_tolerance)
+
+
+def debounce_batch(streams, stable_min_frames=STABLE_MIN_FRAMES, gap_tolerance=GAP_TOLERANCE):
+    """
+    Viele Streams auf einmal: alle Streams laufen im Gleichschritt über ihre Läufe,
+    jeder Schritt ist eine Vektoroperation über alle Streams.
+    Gibt pro Stream die Bitfolge zurück, identisch zu [debounce(s) for s in streams].
+    """
+    values, lengths = batch_run_lengths(streams)
+    n = len(streams)
+    state = np.full(n, _NONE, dtype=np.int8)
+    count = np.zeros(n, dtype=np.int64)
+    gap = np.zeros(n, dtype=np.int64)
+    emitted = np.full(values.shape, _NONE, dtype=np.int8)
+
+    for j in range(values.shape[1]):
+        value, length = values[:, j], lengths[:, j]
+        active = length > 0
+        stable = (count >= stable_min_frames) & (state >= 0)
+
+        is_none = active & (state == _NONE)
+        is_same = active & ~is_none & (value == state)
+        is_gap = active & ~is_none & ~is_same & (value == -1)
+        is_change = active & ~is_none & ~is_same & ~is_gap
+
+        # 3: Lücke
+        needed = gap_tolerance - gap + 1
+        ends = is_gap & (length >= needed)
+        rest = length - needed
+        emit = (ends | is_change) & stable
+        emitted[emit, j] = state[emit]
+
+        new_state = state.copy()
+        new_count = count.copy()
+        new_gap = gap.copy()
+
+        # 1: kein Zustand
+        new_state[is_none] = value[is_none]
+        new_count[is_none] = length[is_none]
+        new_gap[is_none] = 0
+
+        # 2: gleicher Wert
+        new_count[is_same] += length[is_same]
+        new_gap[is_same] = 0
+
+        # 3: Lücke
+        new_gap[is_gap & ~ends] += length[is_gap & ~ends]
+        restart = ends & (rest > 0)
+        new_state[ends] = np.where(restart[ends], -1, _NONE)
+        new_count[ends] = np.where(restart[ends], rest[ends], 0)
+        new_gap[ends] = 0
+
+        # 4: anderer Wert
+        change_stable = is_change & stable
+        change_unstable = is_change & ~stable
+        new_count[change_stable] = length[change_stable]
+        new_gap[change_stable] = 0
+        new_count[change_unstable] += length[change_unstable] - 1
+        new_gap[change_unstable & (length > 1)] = 0
+        new_state[is_change] = value[is_change]
+
+        state, count, gap = new_state, new_count, new_gap
+
+    final = (count >= stable_min_frames) & (state >= 0)
+    results = []
+    for i in range(n):
+        row = emitted[i]
+        bits = row[row >= 0].tolist()
+        if final[i]:
+            bits.append(int(state[i]))
+        results.append(bits)
+    return results
@@ -0,0 +1,129 @@
+from .lexicon_index import lexicon_fingerprint
+from .morse import bits_for_word, hamming_distance
+
+
+# --- Trie der Morse-Codes ---
+class TrieNode:
+    """Knoten im Bit-Trie: children[0]/children[1] und die Wörter, die hier enden."""
+    __slots__ = ("children", "words")
+
+    def __init__(self):
+        self.children = [None, None]
+        self.words = []
+
+
+def build_trie(base_words, morse_table):
+    """Baut einen Trie über die Morse-Bitfolgen der Basiswörter (Buchstaben-Codes aneinandergehängt)."""
+    root = TrieNode()
+    for word in sorted(base_words):
+        node = root
+        bits = [b for ch in word if ch in morse_table for b in morse_table[ch]]
+        if not bits:
+            continue
+        for b in bits:
+            if node.children[b] is None:
+                node.children[b] = TrieNode()
+            node = node.children[b]
+        node.words.append(word)
+    return root
+
+
+# --- Segmentierender Decoder ---
+class SegmentDecoder:
+    """
+    Zerlegt die beobachtete Bitfolge direkt in Basiswörter, statt alle Permutationen
+    aufzuzählen (z.B. "MEIN NAME IST ARSHIA" mit beliebig vielen Wörtern).
+
+    Gitter (Lattice) über die Bitpositionen: an jeder Position liegt ein Beam von
+    Hypothesen (Kosten, Wortfolge). Von jeder Position aus wird der Trie mit den
+    folgenden Bits abgelaufen; pro Wort sind höchstens max_word_errors Bitfehler
+    erlaubt. Kosten = Hamming-Distanz der Phrase wie bei hamming_distance
+    (Fehler + Längenstrafe). Ein einzelnes Bit darf zusätzlich übersprungen werden
+    (Kosten 1, z.B. ein eingeschobenes Flacker-Bit), damit auch Folgen ohne passenden
+    Wortanfang eine Zerlegung haben. Aufwand ~ Anzahl Bits x Trie-Größe.
+    """
+
+    def __init__(self, base_words, morse_table, max_word_errors=2, beam_width=10,
+                 max_words=None, allow_repeats=True):
+        self.root = build_trie(base_words, morse_table)
+        self.codes = {word: bits_for_word(word, morse_table) for word in base_words}
+        self.max_word_errors = max_word_errors
+        self.beam_width = beam_width
+        self.max_words = max_words
+        self.allow_repeats = allow_repeats
+        self.fingerprint = lexicon_fingerprint(base_words, morse_table,
+                                               [max_word_errors, beam_width, max_words, allow_repeats])
+
+    def walk(self, bits, start):
+        """
+        Erzeugt (Ende, Fehler, Wörter) für alle Wörter, die ab start mit höchstens
+        max_word_errors Fehlern passen. Bits über das Ende der Beobachtung hinaus
+        zählen je als ein Fehler (Längenstrafe).
+        """
+        n = len(bits)
+        stack = [(self.root, start, 0)]
+        while stack:
+            node, pos, errors = stack.pop()
+            if node.words:
+                yield pos, errors, node.words
+            for bit, child in enumerate(node.children):
+                if child is None:
+                    continue
+                e = errors + (pos >= n or bits[pos] != bit)
+                if e <= self.max_word_errors:
+                    stack.append((child, pos + 1, e))
+
+    @staticmethod
+    def prune(hyps, width):
+        """Behält die width besten verschiedenen Hypothesen, sortiert nach (Kosten, Wortanzahl, Phrase)."""
+        best = {}
+        for cost, words in hyps:
+            if words not in best or cost < best[words]:
+                best[words] = cost
+        ranked = sorted(best.items(), key=lambda h: (h[1], len(h[0]), " ".join(h[0])))
+        return [(cost, words) for words, cost in ranked[:width]]
+
+    def search(self, bits, beam_size=10):
+        """
+        Dekodiert die Bitfolge über das Gitter.
+        Rückgabe: Liste von (Distanz, Phrase), sortiert nach (Distanz, Wortanzahl, Phrase).
+        """
+        n = len(bits)
+        lattice = {0: [(0, ())]}
+        finals = []
+
+        for pos in range(max(n, 1)):
+            if pos not in lattice:
+                continue
+            hyps = self.prune(lattice.pop(pos), self.beam_width)
+            # hier aufhören: die restlichen Bits zählen als Längenstrafe
+            finals.extend((cost + n - pos, path) for cost, path in hyps if path)
+
+            if pos < n:
+                # Bit überspringen
+                lattice.setdefault(pos + 1, []).extend((cost + 1, path) for cost, path in hyps)
+
+            for end, errors, words in self.walk(bits, pos):
+                for cost, path in hyps:
+                    if self.max_words is not None and len(path) >= self.max_words:
+                        continue
+                    for word in words:
+                        if not self.allow_repeats and word in path:
+                            continue
+                        lattice.setdefault(end, []).append((cost + errors, path + (word,)))
+
+        # Hypothesen, die vor dem Ende aufhören, zahlen die fehlenden Bits als Strafe
+        for end, hyps in lattice.items():
+            penalty = max(0, n - end)
+            finals.extend((cost + penalty, path) for cost, path in hyps if path)
+
+        if not finals:
+            # keine Zerlegung (z.B. leere Bitfolge): bestes einzelnes Wort als Schätzung
+            finals = [(hamming_distance(bits, code), (word,)) for word, code in self.codes.items()]
+        return [(cost, " ".join(path)) for cost, path in self.prune(finals, beam_size)]
+
+    def nearest(self, bits, beam_size=10, distance="hamming", max_dist=None):
+        """Die beam_size besten Segmentierungen (höchstens max_dist entfernt) als Liste von (Phrase, Distanz)."""
+        if distance != "hamming":
+            raise ValueError(f"{type(self).__name__} unterstützt nur distance='hamming', nicht {distance!r}")
+        return [(w, d) for d, w in self.search(bits, beam_size) if max_dist is None or d <= max_dist]
@@ -0,0 +1,141 @@
+from .profiling import PROFILER
+
+
+STABLE_MIN_FRAMES = 31     # Mindestlänge für stabilen Zustand
+GAP_TOLERANCE = 20         # Maximal erlaubte Unterbrechung in Frames, bevor neuer Zustand gezählt wird
+
+# Dieselben Schwellen in Sekunden; sie liegen einen Viertel-Frame (bei 30 fps) vor bzw. hinter
+# der Frame-Grenze, damit gerundete Zeitstempel und 29.97 fps genau wie die Frame-Zählung wirken.
+REFERENCE_FPS = 30.0       # Bildrate, auf die die Frame-Schwellen abgestimmt wurden
+STABLE_MIN_SECONDS = (STABLE_MIN_FRAMES - 0.25) / REFERENCE_FPS   # ~1.03 s
+GAP_TOLERANCE_SECONDS = (GAP_TOLERANCE + 0.25) / REFERENCE_FPS    # ~0.68 s
+
+
+# --- Entprellung ---
+class Debouncer:
+    """
+    Inkrementelle Entprellung: nimmt Frame-Zustände (1 = offen, 0 = geschlossen,
+    -1 = keine Hand) einzeln entgegen und meldet ein Bit, sobald es feststeht.
+    Ein Bit gilt als bestätigt, sobald sein Zustand stable_min_frames Frames gehalten
+    hat; das Ende des Segments muss dafür nicht abgewartet werden. Die Bitfolge ist
+    dieselbe wie bei der ursprünglichen Auswertung nach dem ganzen Video.
+    """
+
+    def __init__(self, stable_min_frames=STABLE_MIN_FRAMES, gap_tolerance=GAP_TOLERANCE):
+        self.stable_min_frames = stable_min_frames
+        self.gap_tolerance = gap_tolerance
+        self.reset()
+
+    def reset(self):
+        self.current_state = None
+        self.frame_count = 0
+        self.gap_count = 0
+        self.emitted = False    # Bit des aktuellen Segments schon gemeldet?
+        self.started = False    # hat mit dem letzten push ein neues Segment begonnen?
+
+    def push(self, value, duration=1):
+        """
+        Einen Frame-Zustand verarbeiten; gibt das neu bestätigte Bit zurück, sonst None.
+        duration: Gewicht des Frames (1 = ein Frame; TimedDebouncer: Sekunden).
+        """
+        self.started = False
+        if self.current_state is None:
+            self.current_state = value
+            self.frame_count = duration
+            self.gap_count = 0
+            self.started = True
+        else:
+            if value == self.current_state:
+                self.frame_count += duration
+                self.gap_count = 0  # Unterbrechung beendet
+            elif value == -1:
+                # Kurze Unterbrechung innerhalb eines Zustands ignorieren
+                self.gap_count += duration
+                if self.gap_count > self.gap_tolerance:
+                    # Zustand beenden (ein stabiles Bit wurde bereits gemeldet)
+                    self.reset()
+            else:
+                # Wechsel zu anderem Wert
+                if self.stable:
+                    self.frame_count = duration
+                    self.gap_count = 0
+                    self.emitted = False
+                    self.started = True
+
+                # Sonst zählt der neue Wert auf dem alten Zähler weiter (wie im Original)
+                self.current_state = value
+
+        if self.stable and not self.emitted:
+            self.emitted = True
+            return self.current_state
+        return None
+
+    @property
+    def stable(self):
+        """Hält der aktuelle Zustand (kein -1) schon lange genug?"""
+        return self.frame_count >= self.stable_min_frames and self.current_state not in (None, -1)
+
+    @property
+    def idle(self):
+        """True, wenn gerade kein Zustand verfolgt wird (z.B. nach langer Handpause)."""
+        return self.current_state is None
+
+
+class TimedDebouncer(Debouncer):
+    """
+    Entprellung in Sekunden statt Frames: push(value, timestamp) gewichtet jeden Frame mit
+    dem Abstand zum vorigen Zeitstempel. So liefern 15-, 30- und 60-fps-Quellen, variable
+    Bildraten und ausgedünnte Streams dieselben Bits (bis auf Rundung auf ganze Frames);
+    bei 30 bzw. 29.97 fps genau wie Debouncer.
+    Rückt der Zeitstempel nicht vor (manche Container liefern für CAP_PROP_POS_MSEC immer 0
+    oder einen festen Wert), zählt der Frame mit first_duration, also wie bei 1 / fps.
+    """
+
+    def __init__(self, stable_min_seconds=STABLE_MIN_SECONDS, gap_tolerance_seconds=GAP_TOLERANCE_SECONDS,
+                 first_duration=1 / REFERENCE_FPS):
+        super().__init__(stable_min_seconds, gap_tolerance_seconds)
+        self.first_duration = first_duration   # Dauer eines Frames ohne Zeitabstand (erster, stehender Zeitstempel)
+        self.last_timestamp = None
+
+    def push(self, value, timestamp):
+        """timestamp in Sekunden (z.B. CAP_PROP_POS_MSEC / 1000)."""
+        if self.last_timestamp is None or timestamp <= self.last_timestamp:
+            duration = self.first_duration
+        else:
+            duration = timestamp - self.last_timestamp
+        self.last_timestamp = timestamp
+        return super().push(value, duration)
+
+
+def stream_bits(frames, stable_min_frames=STABLE_MIN_FRAMES, gap_tolerance=GAP_TOLERANCE):
+    """Generator: liefert die bestätigten Bits, während die Frame-Zustände eintreffen."""
+    push = PROFILER.wrap("debounce", Debouncer(stable_min_frames, gap_tolerance).push)
+    for value in frames:  # frames = deine Frame-Analyse (Liste oder laufender Generator)
+        bit = push(value)
+        if bit is not None:
+            yield bit
+
+
+def debounce(frames, stable_min_frames=STABLE_MIN_FRAMES, gap_tolerance=GAP_TOLERANCE):
+    """
+    Wandelt Frame-Zustände (1 = offen, 0 = geschlossen, -1 = keine Hand) in die
+    finale Bitfolge um: nur Zustände, die mindestens stable_min_frames halten,
+    zählen; Lücken bis gap_tolerance Frames werden überbrückt.
+    """
+    return list(stream_bits(frames, stable_min_frames, gap_tolerance))
+
+
+def stream_bits_timed(samples, stable_min_seconds=STABLE_MIN_SECONDS, gap_tolerance_seconds=GAP_TOLERANCE_SECONDS,
+                      first_duration=1 / REFERENCE_FPS):
+    """Wie stream_bits, aber für (Zustand, Zeitstempel in s)-Paare; Schwellen in Sekunden."""
+    push = PROFILER.wrap("debounce", TimedDebouncer(stable_min_seconds, gap_tolerance_seconds, first_duration).push)
+    for value, timestamp in samples:
+        bit = push(value, timestamp)
+        if bit is not None:
+            yield bit
+
+
+def debounce_timed(samples, stable_min_seconds=STABLE_MIN_SECONDS, gap_tolerance_seconds=GAP_TOLERANCE_SECONDS,
+                   first_duration=1 / REFERENCE_FPS):
+    """Finale Bitfolge aus (Zustand, Zeitstempel)-Paaren, unabhängig von der Bildrate."""
+    return list(stream_bits_timed(samples, stable_min_seconds, gap_tolerance_seconds, first_duration))
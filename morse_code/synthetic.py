@@ -0,0 +1,138 @@
+import itertools
+import random
+import time
+
+from .morse import MORSE_TABLE, bits_for_word
+from .state_estimation import GAP_TOLERANCE_SECONDS, STABLE_MIN_SECONDS, stream_bits_timed
+
+
+FPS = 30.0
+HOLD_SECONDS = 1.5       # mittlere Haltedauer pro Bit
+JITTER = 0.1             # relative Streuung der Haltedauer (Standardabweichung)
+SEPARATOR_SECONDS = 1.0  # Hand weg zwischen zwei gleichen Bits (länger als GAP_TOLERANCE)
+WORD_GAP_SECONDS = 2.0   # Hand weg zwischen zwei Texten
+FLICKER = 0.0            # Wahrscheinlichkeit pro Frame für kurzes Flackern (1-2 Frames Gegenzustand)
+DROPOUT = 0.0            # Wahrscheinlichkeit pro Bit für einen kurzen Handverlust (< GAP_TOLERANCE)
+DRIFT = 0.0              # Tempo-Irrfahrt: Standardabweichung der relativen Änderung pro Bit
+TEMPO_RANGE = (0.5, 2.0) # Grenzen des Tempofaktors bei Drift
+
+
+# --- Hilfsfunktionen ---
+def text_bits(text, morse_table=MORSE_TABLE):
+    """Erwartete Bitfolge (Ground Truth) eines Textes."""
+    return bits_for_word(text.upper(), morse_table)
+
+
+def _frames(seconds, fps):
+    return max(int(round(seconds * fps)), 1)
+
+
+# --- Generator ---
+class GestureStream:
+    """
+    Erzeugt aus Text realistische Frame-Zustände (1 = offen, 0 = geschlossen, -1 = keine Hand),
+    wie sie die Frame-Analyse eines Videos liefert:
+    1: jedes Bit wird hold_seconds gehalten (Streuung jitter; drift lässt das Tempo
+       langsam wandern, begrenzt auf TEMPO_RANGE),
+    2: zwischen zwei gleichen Bits ist die Hand separator_seconds weg (sonst kein Wechsel),
+    3: zwischen Texten word_gap_seconds Pause,
+    4: Störungen: flicker (kurzer Gegenzustand) und dropout (kurzer Handverlust).
+    Alles wird lazy erzeugt, auch für unendlich lange Eingaben; seed macht es reproduzierbar.
+    """
+
+    def __init__(self, fps=FPS, hold_seconds=HOLD_SECONDS, jitter=JITTER, separator_seconds=SEPARATOR_SECONDS,
+                 word_gap_seconds=WORD_GAP_SECONDS, flicker=FLICKER, dropout=DROPOUT, drift=DRIFT,
+                 morse_table=MORSE_TABLE, seed=None):
+        self.fps = fps
+        self.hold_seconds = hold_seconds
+        self.jitter = jitter
+        self.separator_seconds = separator_seconds
+        self.word_gap_seconds = word_gap_seconds
+        self.flicker = flicker
+        self.dropout = dropout
+        self.drift = drift
+        self.morse_table = morse_table
+        self.rng = random.Random(seed)
+        self.tempo = 1.0
+
+    def hold(self, state):
+        """Frames für ein gehaltenes Bit, inklusive Flackern und Handverlust."""
+        rng = self.rng
+        seconds = self.hold_seconds * self.tempo * max(1 + rng.gauss(0, self.jitter), 0.2)
+        if self.drift:
+            self.tempo = min(max(self.tempo * (1 + rng.gauss(0, self.drift)), TEMPO_RANGE[0]), TEMPO_RANGE[1])
+        n = _frames(seconds, self.fps)
+
+        dropout_at = dropout_len = -1
+        if rng.random() < self.dropout:
+            dropout_len = rng.randint(1, max(_frames(GAP_TOLERANCE_SECONDS * 0.8, self.fps), 1))
+            dropout_at = rng.randrange(n)
+
+        i = 0
+        while i < n:
+            if i == dropout_at:
+                yield from itertools.repeat(-1, dropout_len)
+            if self.flicker and rng.random() < self.flicker:
+                length = min(rng.randint(1, 2), n - i)
+                yield from itertools.repeat(1 - state, length)
+                i += length
+                continue
+            yield state
+            i += 1
+
+    def pause(self, seconds):
+        return itertools.repeat(-1, _frames(seconds, self.fps))
+
+    def states(self, texts):
+        """Frame-Zustände für eine (auch unendliche) Folge von Texten."""
+        first = True
+        for text in texts:
+            if not first:
+                yield from self.pause(self.word_gap_seconds)
+            first = False
+
+            previous = None
+            for bit in text_bits(text, self.morse_table):
+                if bit == previous:
+                    yield from self.pause(self.separator_seconds)
+                yield from self.hold(bit)
+                previous = bit
+
+    def samples(self, texts):
+        """Wie states, aber als (Zustand, Zeitstempel in s) für TimedDebouncer."""
+        for i, state in enumerate(self.states(texts)):
+            yield state, i / self.fps
+
+
+# --- Auswertung ---
+def evaluate(texts, count=100, stable_min_seconds=STABLE_MIN_SECONDS, gap_tolerance_seconds=GAP_TOLERANCE_SECONDS,
+             decode=None, **stream_settings):
+    """
+    Erzeugt count gestörte Durchläufe je Text, entprellt sie und vergleicht mit der Ground Truth.
+    decode: optionale Funktion Bits -> Text (z.B. decode_with_lexicon_or_estimate) für die Wort-Genauigkeit.
+    Gibt {"runs", "bits_exact", "words_exact", "frames", "frames_per_s"} zurück (Anteile 0..1).
+    """
+    stream = GestureStream(**stream_settings)
+    runs = bits_exact = words_exact = frames = 0
+    elapsed = 0.0
+
+    for _ in range(count):
+        for text in texts:
+            samples = list(stream.samples([text]))
+            start = time.perf_counter()
+            bits = list(stream_bits_timed(samples, stable_min_seconds, gap_tolerance_seconds, 1 / stream.fps))
+            elapsed += time.perf_counter() - start
+
+            runs += 1
+            frames += len(samples)
+            bits_exact += bits == text_bits(text, stream.morse_table)
+            if decode is not None:
+                words_exact += decode(bits) == text.upper()
+
+    return {
+        "runs": runs,
+        "bits_exact": bits_exact / runs if runs else 0.0,
+        "words_exact": words_exact / runs if runs and decode is not None else None,
+        "frames": frames,
+        "frames_per_s": frames / elapsed if elapsed else 0.0,
+    }
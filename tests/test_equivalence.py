@@ -0,0 +1,106 @@
+"""
+Regressionsprüfungen: die optimierten Pfade liefern exakt dasselbe wie ihre Referenz,
+auf zufälligen Eingaben mit festem Seed.
+Ausführen im Hauptordner mit: python -m pytest tests
+"""
+import random
+
+import pytest
+
+from morse_code.lexicon_index import LexiconIndex, edit_distance
+from morse_code.morse import BASE_WORDS, MORSE_TABLE, bits_for_word, expand_lexicon, hamming_distance
+from morse_code.pipeline import pipeline
+from morse_code.state_estimation import debounce, debounce_timed, stream_bits, stream_bits_timed
+
+
+SEED = 13
+ROUNDS = 200
+
+
+# --- Hilfsfunktionen ---
+def random_bits(rng, low=0, high=40):
+    return [rng.randint(0, 1) for _ in range(rng.randint(low, high))]
+
+
+def random_states(rng, frames=600):
+    """Frame-Zustände 1/0/-1 in Läufen zufälliger Länge (kurze Flacker-Läufe eingeschlossen)."""
+    states = []
+    while len(states) < frames:
+        states += [rng.choice((1, 0, -1))] * rng.randint(1, 60)
+    return states[:frames]
+
+
+def perturb(rng, bits, errors=3):
+    """Bitfolge mit einigen gekippten, gelöschten oder eingefügten Bits (nahe an einem Lexikon-Eintrag)."""
+    bits = list(bits)
+    for _ in range(rng.randint(0, errors)):
+        pos = rng.randint(0, len(bits))
+        op = rng.choice(("flip", "drop", "insert"))
+        if op == "insert" or not bits:
+            bits.insert(pos, rng.randint(0, 1))
+        elif op == "drop":
+            del bits[min(pos, len(bits) - 1)]
+        else:
+            bits[min(pos, len(bits) - 1)] ^= 1
+    return bits
+
+
+# --- Lexikon-Suche (Buckets nach unterer Schranke, Früh-Abbruch) ---
+def brute_force(bits, lexicon, beam_size, distance, max_dist=None):
+    """Referenz: jede Phrase kodieren und vergleichen, sortiert nach (Distanz, Phrase)."""
+    measure = hamming_distance if distance == "hamming" else edit_distance
+    scored = sorted((measure(bits, bits_for_word(phrase, MORSE_TABLE)), phrase) for phrase in lexicon)
+    if max_dist is not None:
+        scored = [entry for entry in scored if entry[0] <= max_dist]
+    return scored[:beam_size]
+
+
+def test_index_search_matches_brute_force():
+    rng = random.Random(SEED)
+    lexicon = sorted(expand_lexicon(sorted(BASE_WORDS)[:7], MORSE_TABLE, 3))
+    index = LexiconIndex(lexicon, MORSE_TABLE)
+
+    for _ in range(ROUNDS):
+        if rng.random() < 0.5:
+            bits = random_bits(rng)
+        else:
+            bits = perturb(rng, bits_for_word(rng.choice(lexicon), MORSE_TABLE))
+        beam_size = rng.choice((1, 3, 10))
+        max_dist = rng.choice((None, 0, 1, 2, 4))
+        for distance in ("hamming", "levenshtein"):
+            expected = brute_force(bits, lexicon, beam_size, distance, max_dist)
+            assert index.search(bits, beam_size, max_dist, distance) == expected, (bits, beam_size, distance)
+
+
+# --- Threaded Pipeline (Lesen / Inferenz / Entprellung in eigenen Threads) ---
+def test_pipeline_bits_match_sequential():
+    rng = random.Random(SEED)
+    for _ in range(ROUNDS // 4):
+        states = random_states(rng)
+        frames = [{"state": state} for state in states]   # "Frames", die Inferenz liest den Zustand aus
+
+        def infer(frames):
+            for frame in frames:
+                yield frame["state"]
+
+        queue_size = rng.choice((1, 2, 32))
+        assert list(pipeline(iter(frames), infer, stream_bits, queue_size=queue_size)) == debounce(states)
+
+        fps = rng.choice((15, 30, 60))
+        samples = [(state, i / fps) for i, state in enumerate(states)]
+        threaded = list(pipeline(iter(samples), stream_bits_timed, queue_size=queue_size))
+        assert threaded == debounce_timed(samples)
+
+
+# --- Lauflängen-Entprellung (NumPy) ---
+def test_rle_debounce_matches_loop():
+    pytest.importorskip("numpy")
+    from morse_code.rle_debounce import debounce_batch, debounce_rle
+
+    rng = random.Random(SEED)
+    for _ in range(ROUNDS // 4):
+        stable_min_frames, gap_tolerance = rng.randint(1, 40), rng.randint(0, 25)
+        streams = [random_states(rng, rng.randint(0, 400)) for _ in range(rng.randint(1, 8))]
+        expected = [debounce(states, stable_min_frames, gap_tolerance) for states in streams]
+        assert [debounce_rle(states, stable_min_frames, gap_tolerance) for states in streams] == expected
+        assert debounce_batch(streams, stable_min_frames, gap_tolerance) == expected
@@ -1,14 +1,4 @@
-
-import cv2
-import numpy as np
-import mediapipe as mp
-import time
-
-from typing import List, Tuple
-from functools import lru_cache
-import heapq
-import itertools
-
+from morse_code.capture import frame_rate
 
 
 ##############################################################
@@ -32,8 +22,7 @@ video_path = "Videos/Elham01.mp4"  # <-- Pfad zu deinem Video
 
 ##############################################################
 
-cap = cv2.VideoCapture(video_path)
-
-# Ausgabe
-print(f"Frame rate: {cap.get(cv2.CAP_PROP_FPS)}\n")
 
+if __name__ == "__main__":
+    # Ausgabe
+    print(f"Frame rate: {frame_rate(video_path)}\n")